@@ -8,13 +8,14 @@ Duino-Coin Team & Community 2019-2024
 
 from time import time, sleep, strptime, ctime, time_ns
 from hashlib import sha1
-from socket import socket
+from socket import socket, IPPROTO_TCP, TCP_NODELAY
 
 from multiprocessing import cpu_count, current_process
 from multiprocessing import Process, Manager, Semaphore
 from multiprocessing import Array, Value
 from threading import Thread, Lock
 from collections import defaultdict
+from functools import lru_cache
 from datetime import datetime
 from random import randint
 
@@ -27,6 +28,7 @@ import sys
 import base64 as b64
 import os
 import json
+import shutil
 import zipfile
 import traceback
 import urllib.parse
@@ -52,6 +54,7 @@ libducohasher = None
 fasthash_supported = False
 fasthash_import_error = None
 fasthash_warning_reported = False
+PY_VERSION = tuple(map(int, python_version_tuple()[:2]))
 
 # Python <3.5 check
 f"Your Python version is too old. Duino-Coin Miner requires version 3.6 or above. Update your packages and try again"
@@ -201,6 +204,7 @@ class Settings:
     """
     ENCODING = "UTF8"
     SEPARATOR = ","
+    SEPARATOR_B = SEPARATOR.encode(ENCODING)
     VER = 4.3
     DATA_DIR = "Duino-Coin PC Miner " + str(VER)
     TRANSLATIONS = ("https://raw.githubusercontent.com/"
@@ -400,11 +404,13 @@ class Algorithms:
     For more info about the implementation refer to the Duino whitepaper:
     https://github.com/revoxhere/duino-coin/blob/gh-pages/assets/whitepaper.pdf
     """
+    @lru_cache(maxsize=1)
     def _require_fast_hasher():
         """
         Ensures libducohasher is available before performing hashing.
         Attempts automatic installation and exits with a clear warning
         if the optimized backend cannot be loaded.
+        Only a successful check is cached, a failure always exits.
         """
         global fasthash_supported, fasthash_import_error, libducohasher, fasthash_warning_reported
 
@@ -476,6 +482,8 @@ class Client:
         global s
         s = socket()
         s.settimeout(Settings.SOC_TIMEOUT)
+        # Small request/response messages; don't let Nagle hold them back
+        s.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
         s.connect((pool))
 
     def send(msg: str):
@@ -486,6 +494,19 @@ class Client:
         data = s.recv(limit).decode(Settings.ENCODING).rstrip("\n")
         return data
 
+    def recv_feedback(buffer: bytearray):
+        """
+        Reads share feedback into a reused buffer and returns the
+        verdict as bytes, decoding the reason only when one is sent
+        """
+        size = s.recv_into(buffer)
+        view = memoryview(buffer)[:size]
+        sep = buffer.find(Settings.SEPARATOR_B, 0, size)
+        if sep == -1:
+            return bytes(view).rstrip(b"\n"), None
+        reason = bytes(view[sep + 1:]).decode(Settings.ENCODING).rstrip("\n")
+        return bytes(view[:sep]), reason
+
     def fetch_pool(retry_count=1):
         """
         Fetches the best pool from the /getPool API endpoint
@@ -601,6 +622,28 @@ class Donate:
                          'error', 'sys0')
 
 
+def download_file(url: str, target: str):
+    """
+    Streams a download to disk in chunks instead of holding it
+    in memory, only moving it into place once it's complete
+    """
+    partial = target + ".part"
+    try:
+        with requests.get(url, timeout=Settings.SOC_TIMEOUT, stream=True) as r:
+            r.raise_for_status()
+            r.raw.decode_content = True
+            with open(partial, "wb") as f:
+                shutil.copyfileobj(r.raw, f, length=65536)
+        os.replace(partial, target)
+    except Exception:
+        # Don't leave a half-written file behind
+        try:
+            os.remove(partial)
+        except OSError:
+            pass
+        raise
+
+
 def get_prefix(symbol: str,
                val: float,
                accuracy: int):
@@ -684,23 +727,35 @@ FLUSH_INTERVAL_SEC = 1.0
 FLUSH_INTERVAL_SHARES = 3
 PERFORMANCE_LOG_INTERVAL_SHARES = 25
 PERFORMANCE_LOG_INTERVAL_SEC = 15.0
-
-
-def aggregate_shared_stats(hashrate_array, accept_counts, reject_counts):
+PRINT_BATCH_SIZE = 16
+PRINT_BATCH_SEC = 0.2
+TITLE_INTERVAL_SEC = 0.5
+# Pool feedback -> (share_print type, is rejected, is block)
+SHARE_VERDICTS = {
+    b"GOOD": ("accept", False, False),
+    b"BLOCK": ("block", False, True),
+    b"BAD": ("reject", True, False),
+}
+
+
+def aggregate_shared_stats(shared_stats):
     """
-    Aggregate totals from shared memory primitives.
+    Aggregate totals from the shared stats block, laid out as
+    per-thread hashrates, then accepted and rejected counts.
+    A single slice copies it out in one call instead of
+    reading every element through ctypes.
     """
+    values = shared_stats[:]
+    threads = len(values) // 3
     return {
         "timestamp": time(),
-        "hashrate": float(sum(hashrate_array)),
-        "accept": int(sum(accept_counts)),
-        "reject": int(sum(reject_counts)),
+        "hashrate": float(sum(values[:threads])),
+        "accept": int(sum(values[threads:2 * threads])),
+        "reject": int(sum(values[2 * threads:])),
     }
 
 
-def refresh_cached_totals(cache, shares_since_update,
-                          hashrate_array, accept_counts,
-                          reject_counts):
+def refresh_cached_totals(cache, shares_since_update, shared_stats):
     """
     Return cached totals, refreshing them when enough
     shares passed or when the cache is stale.
@@ -709,11 +764,32 @@ def refresh_cached_totals(cache, shares_since_update,
     if (cache is None
         or shares_since_update >= AGGREGATION_INTERVAL_SHARES
         or now_time - cache["timestamp"] >= AGGREGATION_INTERVAL_SEC):
-        return aggregate_shared_stats(
-            hashrate_array, accept_counts, reject_counts), 0
+        return aggregate_shared_stats(shared_stats), 0
     return cache, shares_since_update
 
 
+def pin_to_core(id):
+    """
+    Pins the calling worker process to a single core so the
+    hashing state stays hot in that core's caches
+    """
+    core = None
+    try:
+        # Pick from the CPUs this process may use (taskset, cgroups,
+        # containers), not from every core in the machine
+        if hasattr(os, "sched_setaffinity"):
+            allowed = sorted(os.sched_getaffinity(0))
+            core = allowed[id % len(allowed)]
+            os.sched_setaffinity(0, {core})
+        else:
+            process = psutil.Process()
+            allowed = sorted(process.cpu_affinity())
+            core = allowed[id % len(allowed)]
+            process.cpu_affinity([core])
+    except Exception as e:
+        debug_output(f"Could not pin cpu{id} to core {core}: {e}")
+
+
 def calculate_uptime(start_time):
     """
     Returns seconds, minutes or hours passed since timestamp
@@ -860,16 +936,46 @@ def share_print(id, type,
               + f"ping {(int(ping))}ms")
 
 
+class PrintBuffer:
+    """
+    Collects a worker's messages locally and hands them to the
+    shared print queue in batches, saving a manager round-trip
+    per message. The time limit is only checked on append, so
+    callers flush() before blocking on the network
+    """
+    def __init__(self, print_queue):
+        self.print_queue = print_queue
+        self.pending = []
+        self.last_flush = time()
+
+    def append(self, message):
+        self.pending.append(message)
+        self.flush_if_due()
+
+    def flush_if_due(self):
+        if self.pending and (
+                len(self.pending) >= PRINT_BATCH_SIZE
+                or time() - self.last_flush >= PRINT_BATCH_SEC):
+            self.flush()
+
+    def flush(self):
+        if self.pending:
+            self.print_queue.extend(self.pending)
+            self.pending.clear()
+        self.last_flush = time()
+
+
 def print_queue_handler(print_queue):
     """
     Prevents broken console logs with many threads
     """
     while True:
         if len(print_queue):
-            message = print_queue[0]
+            messages = print_queue[:]
+            del print_queue[:len(messages)]
             with printlock:
-                print(message)
-            print_queue.pop(0)
+                for message in messages:
+                    print(message)
         sleep(0.01)
 
 
@@ -1291,13 +1397,13 @@ class Miner:
 
     def mine(id: int, user_settings: list,
              blocks, pool: tuple,
-             accept_counts, reject_counts,
-             hashrate_array,
+             shared_stats,
              single_miner_id: str,
              print_queue):
         """
         Main section that executes the functionalities from the sections above.
         """
+        print_queue = PrintBuffer(print_queue)
         using_algo = get_string("using_algo")
         pretty_print(get_string("mining_thread") + str(id)
                      + get_string("mining_thread_starting")
@@ -1305,6 +1411,8 @@ class Miner:
                      + str(user_settings["intensity"])
                      + "% " + get_string("efficiency"),
                      "success", "sys"+str(id), print_queue=print_queue)
+        print_queue.flush()
+        pin_to_core(id)
 
         last_report = time()
         r_shares, last_shares = 0, 0
@@ -1312,8 +1420,13 @@ class Miner:
         shares_since_cache = 0
         flush_shares = 0
         last_flush = time()
-        cached_totals = aggregate_shared_stats(
-            hashrate_array, accept_counts, reject_counts)
+        last_title = 0
+        feedback_buf = bytearray(128)
+        threads = len(shared_stats) // 3
+        hashrate_slot = id
+        accept_slot = threads + id
+        reject_slot = 2 * threads + id
+        cached_totals = aggregate_shared_stats(shared_stats)
 
         # Adaptive tuning and pool selection state
         current_intensity = int(user_settings["intensity"])
@@ -1354,13 +1467,18 @@ class Miner:
                     best_ping = stats["latency"]
             return best_pool
 
-        def _should_switch_pool(avg_ping):
+        def _average_ping():
+            return sum(recent_pings) / len(recent_pings) if recent_pings else 0
+
+        def _should_switch_pool(ping_provider):
+            # Cheap checks first, the ping average is only needed
+            # once the pool has been in use for long enough
             time_since_switch = time() - last_pool_switch
-            if avg_ping > 800 and time_since_switch > 30:
-                return True
-            if pool_metrics[current_pool]["errors"] >= 3 and time_since_switch > 10:
+            if time_since_switch <= 10:
+                return False
+            if pool_metrics[current_pool]["errors"] >= 3:
                 return True
-            return False
+            return time_since_switch > 30 and ping_provider() > 800
 
         def _tune_intensity():
             nonlocal current_intensity, tuning_snapshot
@@ -1373,7 +1491,7 @@ class Miner:
             total_delta = accept_delta + reject_delta
             reject_ratio = (reject_delta / total_delta) if total_delta > 0 else 0
 
-            avg_ping = sum(recent_pings) / len(recent_pings) if recent_pings else 0
+            avg_ping = _average_ping()
             temp = get_cpu_temperature()
             too_hot = temp is not None and temp > 80
 
@@ -1412,6 +1530,10 @@ class Miner:
                         if user_settings["raspi_cpu_iot"] == "y" and running_on_rpi:
                             raspi_iot_reading = f"CPU temperature:{get_rpi_temperature()}*C"
 
+                        # Hand buffered output over before blocking on the
+                        # node, so it never waits out a whole job round-trip
+                        print_queue.flush()
+
                         # Request job from server (sequential, no prefetching)
                         while True:
                             Client.send("JOB"
@@ -1431,6 +1553,7 @@ class Miner:
                                 pretty_print(
                                     "Node message: " + str(job[1]),
                                     "warning", print_queue=print_queue)
+                                print_queue.flush()
                                 sleep(3)
 
                         while True:
@@ -1442,7 +1565,7 @@ class Miner:
                                 job[0], job[1], int(job[2]), eff)
                             computetime = time() - time_start
 
-                            hashrate_array[id] = result[1]
+                            shared_stats[hashrate_slot] = result[1]
                             prep_identifier = user_settings['identifier']
                             if running_on_rpi:
                                 if prep_identifier != "None":
@@ -1450,21 +1573,24 @@ class Miner:
                                 else:
                                     prep_identifier = "Raspberry Pi"
 
+                            submission = (f"{result[0]}"
+                                          + Settings.SEPARATOR
+                                          + f"{result[1]}"
+                                          + Settings.SEPARATOR
+                                          + "Official PC Miner"
+                                          + f" {Settings.VER}"
+                                          + Settings.SEPARATOR
+                                          + f"{prep_identifier}"
+                                          + Settings.SEPARATOR
+                                          + Settings.SEPARATOR
+                                          + f"{single_miner_id}")
+
                             while True:
-                                Client.send(f"{result[0]}"
-                                            + Settings.SEPARATOR
-                                            + f"{result[1]}"
-                                            + Settings.SEPARATOR
-                                            + "Official PC Miner"
-                                            + f" {Settings.VER}"
-                                            + Settings.SEPARATOR
-                                            + f"{prep_identifier}"
-                                            + Settings.SEPARATOR
-                                            + Settings.SEPARATOR
-                                            + f"{single_miner_id}")
+                                print_queue.flush()
+                                Client.send(submission)
 
                                 time_start = time()
-                                feedback = Client.recv().split(Settings.SEPARATOR)
+                                verdict_b, reason = Client.recv_feedback(feedback_buf)
                                 ping = (time() - time_start) * 1000
 
                                 recent_pings.append(ping)
@@ -1472,48 +1598,36 @@ class Miner:
                                     recent_pings.pop(0)
                                 _update_pool_latency(current_pool, ping)
 
-                                if feedback[0] == "GOOD":
-                                    local_accept += 1
-                                    share_print(id, "accept",
-                                                local_accept, local_reject,
-                                                result[1], cached_totals["hashrate"] if cached_totals else result[1],
-                                                computetime, job[2], ping,
-                                                back_color,
-                                                print_queue=print_queue)
-
-                                elif feedback[0] == "BLOCK":
-                                    local_accept += 1
-                                    blocks.value += 1
-                                    share_print(id, "block",
+                                verdict = SHARE_VERDICTS.get(verdict_b)
+                                if verdict is not None:
+                                    share_type, is_reject, is_block = verdict
+                                    if is_reject:
+                                        local_reject += 1
+                                        pool_metrics[current_pool]["errors"] += 1
+                                    else:
+                                        local_accept += 1
+                                        if is_block:
+                                            blocks.value += 1
+                                    share_print(id, share_type,
                                                 local_accept, local_reject,
                                                 result[1], cached_totals["hashrate"] if cached_totals else result[1],
                                                 computetime, job[2], ping,
                                                 back_color,
-                                                print_queue=print_queue)
-
-                                elif feedback[0] == "BAD":
-                                    local_reject += 1
-                                    pool_metrics[current_pool]["errors"] += 1
-                                    share_print(id, "reject",
-                                                local_accept, local_reject,
-                                                result[1], cached_totals["hashrate"] if cached_totals else result[1],
-                                                computetime, job[2], ping,
-                                                back_color, feedback[1],
+                                                reason if is_reject else None,
                                                 print_queue=print_queue)
 
                                 flush_shares += 1
                                 shares_since_cache += 1
                                 if (flush_shares >= FLUSH_INTERVAL_SHARES
                                     or time() - last_flush >= FLUSH_INTERVAL_SEC):
-                                    accept_counts[id] = local_accept
-                                    reject_counts[id] = local_reject
+                                    shared_stats[accept_slot] = local_accept
+                                    shared_stats[reject_slot] = local_reject
                                     last_flush = time()
                                     flush_shares = 0
 
                                 cached_totals, shares_since_cache = refresh_cached_totals(
                                     cached_totals, shares_since_cache,
-                                    hashrate_array, accept_counts,
-                                    reject_counts)
+                                    shared_stats)
 
                                 if (cached_totals
                                     and cached_totals["accept"] % 100 == 0
@@ -1522,8 +1636,10 @@ class Miner:
                                         f"{get_string('surpassed')} {cached_totals['accept']} {get_string('surpassed_shares')}",
                                         "success", "sys0", print_queue=print_queue)
 
-                                _update_title()
-                                _tune_intensity()
+                                if time() - last_title >= TITLE_INTERVAL_SEC:
+                                    _update_title()
+                                    _tune_intensity()
+                                    last_title = time()
 
                                 if id == 0:
                                     end_time = time()
@@ -1532,8 +1648,7 @@ class Miner:
                                         if cached_totals is None:
                                             cached_totals, shares_since_cache = refresh_cached_totals(
                                                 cached_totals, shares_since_cache,
-                                                hashrate_array, accept_counts,
-                                                reject_counts)
+                                                shared_stats)
                                         r_shares = cached_totals["accept"] - last_shares
                                         uptime = calculate_uptime(
                                             mining_start_time)
@@ -1545,8 +1660,7 @@ class Miner:
                                         last_report = time()
                                         last_shares = cached_totals["accept"]
 
-                                avg_ping = sum(recent_pings) / len(recent_pings) if recent_pings else 0
-                                if _should_switch_pool(avg_ping):
+                                if _should_switch_pool(_average_ping):
                                     try:
                                         new_pool = Client.fetch_pool()
                                         pool_metrics[new_pool]  # initialize
@@ -1558,18 +1672,21 @@ class Miner:
                                         last_pool_switch = time()
                                     except Exception:
                                         pass
+                                print_queue.flush_if_due()
                                 break
                             break
                     except Exception as e:
                         pretty_print(get_string("error_while_mining")
                                      + " " + str(e), "error", "net" + str(id),
                                      print_queue=print_queue)
+                        print_queue.flush()
                         sleep(5)
                         break
             except Exception as e:
                 pretty_print(get_string("error_while_mining")
                              + " " + str(e), "error", "net" + str(id),
                              print_queue=print_queue)
+                print_queue.flush()
                 pool_metrics[current_pool]["errors"] += 1
                 sleep(5)
 
@@ -1589,10 +1706,17 @@ class Discord_rp:
           
 
     def update():
+        if sys.platform.startswith("linux"):
+            # Keep the presence updates from preempting mining workers.
+            # Only Linux applies nice per thread; elsewhere it would
+            # lower the priority of the whole miner process
+            try:
+                os.nice(5)
+            except OSError:
+                pass
         while True:
             try:
-                cache = aggregate_shared_stats(
-                    hashrate_array, accept_counts, reject_counts)
+                cache = aggregate_shared_stats(shared_stats)
                 total_hashrate = get_prefix("H/s", cache["hashrate"], 2)
                 RPC.update(details="Hashrate: " + str(total_hashrate),
                            start=mining_start_time,
@@ -1617,15 +1741,20 @@ class Discord_rp:
 
 class Fasthash:
     def init():
+        global libducohasher, fasthash_supported, fasthash_import_error
         try:
             """
             Check whether libducohash fasthash is available
             to speed up the DUCOS1 work, created by @HGEpro
             """
-            import libducohasher
+            if libducohasher is None:
+                import libducohasher as _libducohasher
+                libducohasher = _libducohasher
+                fasthash_supported = True
+                fasthash_import_error = None
             pretty_print(get_string("fasthash_available"), "info")
         except Exception as e:
-            if int(python_version_tuple()[1]) <= 6:
+            if PY_VERSION <= (3, 6):
                 pretty_print(
                     (f"Your Python version is too old ({python_version()}).\n"
                      + "Fasthash accelerations and other features may not work"
@@ -1641,15 +1770,26 @@ class Fasthash:
                      + f"(Libducohash couldn't be loaded: {str(e)})"
                      ).replace("\n", "\n\t\t"), 'warning', 'sys0')
 
-    def load():
+    def _download(url, target, messages=None):
+        try:
+            download_file(url, target)
+        except Exception as e:
+            pretty_print(f"Fasthash download failed: {e}", "warning", "sys0",
+                         print_queue=messages)
+
+    def load(messages=None):
+        """
+        Fetches the hasher if needed; with a messages list the status
+        output is collected there instead of printed, for callers
+        running this next to other console output
+        """
         if os.name == 'nt':
             if not Path("libducohasher.pyd").is_file():
-                pretty_print(get_string("fasthash_download"), "info")
+                pretty_print(get_string("fasthash_download"), "info",
+                             print_queue=messages)
                 url = ('https://server.duinocoin.com/'
                        + 'fasthash/libducohashWindows.pyd')
-                r = requests.get(url, timeout=Settings.SOC_TIMEOUT)
-                with open(f"libducohasher.pyd", 'wb') as f:
-                    f.write(r.content)
+                Fasthash._download(url, "libducohasher.pyd", messages)
                 return
         elif os.name == "posix":
             if osprocessor() == "aarch64":
@@ -1671,13 +1811,13 @@ class Fasthash:
                      + "https://github.com/revoxhere/duino-coin/wiki/"
                      + "How-to-compile-fasthash-accelerations\n"
                      + f"(Invalid processor architecture: {osprocessor()})"
-                     ).replace("\n", "\n\t\t"), 'warning', 'sys0')
+                     ).replace("\n", "\n\t\t"), 'warning', 'sys0',
+                    print_queue=messages)
                 return
             if not Path("libducohasher.so").is_file():
-                pretty_print(get_string("fasthash_download"), "info")
-                r = requests.get(url, timeout=Settings.SOC_TIMEOUT)
-                with open("libducohasher.so", "wb") as f:
-                    f.write(r.content)
+                pretty_print(get_string("fasthash_download"), "info",
+                             print_queue=messages)
+                Fasthash._download(url, "libducohasher.so", messages)
                 return
         else:
             pretty_print(
@@ -1686,7 +1826,8 @@ class Fasthash:
                  + "https://github.com/revoxhere/duino-coin/wiki/"
                  + "How-to-compile-fasthash-accelerations\n"
                  + f"(Invalid OS: {os.name})"
-                 ).replace("\n", "\n\t\t"), 'warning', 'sys0')
+                 ).replace("\n", "\n\t\t"), 'warning', 'sys0',
+                print_queue=messages)
             return
 
 
@@ -1711,9 +1852,17 @@ if __name__ == "__main__":
     Thread(target=print_queue_handler, args=[print_queue]).start()
 
     user_settings = Miner.load_cfg()
+    # Fetch the hasher while the greeting is being displayed; its
+    # messages are held back so they can't interleave with the greeting
+    fasthash_messages = []
+    fasthash_loader = Thread(target=Fasthash.load, args=[fasthash_messages])
+    fasthash_loader.start()
     Miner.greeting()
 
-    Fasthash.load()
+    fasthash_loader.join()
+    with printlock:
+        for message in fasthash_messages:
+            print(message)
     Fasthash.init()
     
     if not "raspi_leds" in user_settings:
@@ -1776,9 +1925,8 @@ if __name__ == "__main__":
                      "warning")
         sleep(10)
 
-    hashrate_array = Array('d', threads, lock=False)
-    accept_counts = Array('L', threads, lock=False)
-    reject_counts = Array('L', threads, lock=False)
+    # Hashrates, accepted and rejected counts, one row of threads each
+    shared_stats = Array('d', threads * 3, lock=False)
     blocks = Value('L', 0)
 
     fastest_pool = Client.fetch_pool()
@@ -1786,8 +1934,8 @@ if __name__ == "__main__":
     for i in range(threads):
         p = Process(target=Miner.mine,
                     args=[i, user_settings, blocks,
-                          fastest_pool, accept_counts, reject_counts,
-                          hashrate_array, single_miner_id, 
+                          fastest_pool, shared_stats,
+                          single_miner_id, 
                           print_queue])
         p_list.append(p)
         p.start()
@@ -1,2 +1,3 @@
 """GUI package for the Duino Coin desktop application."""
 
+__version__ = "4.3"
@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import asdict, dataclass, field, replace
+import sys
+from dataclasses import dataclass, field, fields, replace
 from pathlib import Path
-from typing import List
+from typing import Any, List
 
 
 CONFIG_PATH = Path.home() / ".duinocoin_gui.json"
 THEMES = {"system", "light", "dark"}
+# Slotted dataclasses need Python 3.10+; older interpreters get regular ones.
+DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 def _default_threads() -> int:
@@ -19,7 +22,7 @@ def _default_threads() -> int:
     return max(1, cpu_count - 1)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Configuration:
     """Persistent user configuration for the miners."""
 
@@ -30,6 +33,8 @@ class Configuration:
     port: int = 2813
     auto_start: bool = False
     refresh_interval: int = 5
+    # Back off wallet polling while the balance stays unchanged.
+    adaptive_refresh: bool = True
     theme: str = "system"
 
 
@@ -66,11 +71,27 @@ def validate_config(config: Configuration) -> Configuration:
     if errors:
         raise ValueError("\n".join(errors))
 
-    return replace(config, server=config.server.strip(), theme=normalized_theme)
+    server = config.server.strip()
+    if server == config.server and normalized_theme == config.theme:
+        # Already normalized; skip rebuilding the dataclass.
+        return config
+    return replace(config, server=server, theme=normalized_theme)
+
+
+def config_to_dict(config: Configuration) -> dict[str, Any]:
+    """Return a field-name to value mapping (works with slotted dataclasses).
+
+    List fields are copied so callers can mutate the result without touching ``config``.
+    """
+    values = {}
+    for f in fields(config):
+        value = getattr(config, f.name)
+        values[f.name] = list(value) if isinstance(value, list) else value
+    return values
 
 
 def _merge_config(defaults: Configuration, overrides: dict) -> Configuration:
-    merged = asdict(defaults)
+    merged = config_to_dict(defaults)
     merged.update(overrides)
     return Configuration(**merged)
 
@@ -95,4 +116,4 @@ def save_config(config: Configuration, path: Path = CONFIG_PATH) -> None:
     """Persist configuration to disk after validation."""
 
     validated = validate_config(config)
-    path.write_text(json.dumps(asdict(validated), indent=2))
+    path.write_text(json.dumps(config_to_dict(validated), indent=2))
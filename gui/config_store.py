@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import asdict, replace
+from dataclasses import replace
 from pathlib import Path
 from typing import Any
 
+from .config import config_to_dict
 from .state import Configuration
 
 
@@ -20,16 +21,15 @@ ENV_TOKEN = "DUINO_WALLET_TOKEN"
 
 
 def _merge_config_dict(base: dict[str, Any], updates: dict[str, Any]) -> dict[str, Any]:
+    allowed = frozenset(base)
     merged = base.copy()
-    for key, value in updates.items():
-        if key in merged:
-            merged[key] = value
+    merged.update({key: value for key, value in updates.items() if key in allowed})
     return merged
 
 
 def load_config(defaults: Configuration) -> Configuration:
     """Load persisted configuration with environment overrides."""
-    data = asdict(defaults)
+    data = config_to_dict(defaults)
 
     if CONFIG_PATH.exists():
         try:
@@ -51,7 +51,7 @@ def load_config(defaults: Configuration) -> Configuration:
 def save_config(config: Configuration) -> None:
     """Persist configuration to disk with restricted permissions."""
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    serialized = asdict(config)
+    serialized = config_to_dict(config)
     CONFIG_PATH.write_text(json.dumps(serialized, indent=2), encoding="utf-8")
     try:
         CONFIG_PATH.chmod(0o600)
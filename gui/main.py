@@ -3,15 +3,35 @@
 from __future__ import annotations
 
 import json
+import re
 import sys
+import threading
 import time
-from concurrent.futures import Future, ThreadPoolExecutor
-from dataclasses import replace
+from collections import deque
+from concurrent.futures import Future
+from contextlib import contextmanager, suppress
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Iterable, Optional
+from typing import Callable, Iterable, Iterator, Optional
 
 import requests
-from PySide6.QtCore import QObject, Qt, QThread, QTimer, Signal
+from requests.adapters import HTTPAdapter
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QEvent,
+    QFileSystemWatcher,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    Qt,
+    QThread,
+    QThreadPool,
+    QTimer,
+    Signal,
+    SignalInstance,
+    Slot,
+)
+from PySide6.QtGui import QBrush, QColor, QPainter, QPalette, QPen, QPixmap
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -24,8 +44,8 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QListView,
     QListWidget,
-    QListWidgetItem,
     QMainWindow,
     QMessageBox,
     QPlainTextEdit,
@@ -43,12 +63,15 @@ if __package__ in (None, ""):
         sys.path.append(str(project_root))
     __package__ = "gui"
 
-from .config import Configuration, THEMES, validate_config
+from . import __version__
+from .config import THEMES, config_to_dict, validate_config
 from .config_store import load_config, save_config
 from .metrics import MinerMetricsParser
 from .miner_process import MinerProcessManager
 from .state import (
+    DEFAULT_METRICS,
     AppState,
+    Configuration,
     LiveStats,
     MinerLogEntry,
     MinerMetrics,
@@ -56,19 +79,105 @@ from .state import (
     NotificationEntry,
     WalletData,
 )
-from .wallet_client import WalletAuthError, WalletClient, WalletClientError, WalletCredentials
+from .throttle import Throttler
+from .wallet_client import (
+    REQUEST_TIMEOUT,
+    AdaptiveRefreshInterval,
+    WalletAuthError,
+    WalletCache,
+    WalletClient,
+    WalletClientError,
+    WalletCredentials,
+    WalletStreamTimeout,
+    WalletStreamUnavailable,
+    load_json,
+)
 from .wallet_dialog import WalletCredentialsDialog
 
 
+# Shared session so wallet refreshes and their retries reuse TCP/TLS connections.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+_SESSION.headers["User-Agent"] = f"duinocoin-gui/{__version__}"
+WALLET_CACHE_TTL = 5.0
+WALLET_STREAM_RETRY_MS = 60_000
+# While the push stream is live, poll this rarely as a watchdog; with ETags
+# the check is usually a bodiless 304.
+WALLET_WATCHDOG_MS = 300_000
+# Comma-separated device names with surrounding whitespace trimmed and empties skipped.
+GPU_DEVICE_PATTERN = re.compile(r"[^,\s][^,]*[^,\s]|[^,\s]")
+
+
+def _wallet_cache_ttl(refresh_interval: int) -> float:
+    # Keep the TTL under the refresh interval so scheduled refreshes still hit the API.
+    return min(WALLET_CACHE_TTL, refresh_interval / 2)
+
+
+_UNSET = object()
+
+
+def _text_palette(color: str) -> QPalette:
+    palette = QPalette()
+    palette.setColor(QPalette.WindowText, QColor(color))
+    return palette
+
+
+# Label colors; palettes and fonts keep the window free of style sheets entirely.
+_PALETTES = {
+    "running": _text_palette("green"),
+    "stopped": _text_palette("#a00"),
+    "idle": _text_palette("gray"),
+    "disconnected": _text_palette("red"),
+    "alert": _text_palette("#ef5350"),
+}
+
+
+def _set_bold(label: QLabel) -> None:
+    font = label.font()
+    font.setBold(True)
+    label.setFont(font)
+
+
+def _reserve_width(label: QLabel, sample: str) -> None:
+    """Size ``label`` for its widest expected text so updates do not relayout the form."""
+    label.setMinimumWidth(label.fontMetrics().horizontalAdvance(sample))
+
+
+@contextmanager
+def _batch_updates(*widgets: QWidget) -> Iterator[None]:
+    """Block signals on ``widgets`` for the duration, restoring each prior state."""
+    saved = [widget.blockSignals(True) for widget in widgets]
+    try:
+        yield
+    finally:
+        for widget, blocked in zip(widgets, saved):
+            widget.blockSignals(blocked)
+
+
+def _changed(cache: dict[str, object], key: str, value: object) -> bool:
+    """Record ``value`` under ``key`` and report whether it differs from the last one."""
+    if cache.get(key, _UNSET) == value:
+        return False
+    cache[key] = value
+    return True
+
+
 def format_hashrate(hashrate: float) -> str:
     """Return a human-friendly hashrate string."""
-    if hashrate >= 1_000_000:
-        return f"{hashrate / 1_000_000:.2f} MH/s"
-    if hashrate >= 1_000:
-        return f"{hashrate / 1_000:.2f} kH/s"
-    return f"{hashrate:.2f} H/s"
+    # Bucket to hundredths of a H/s, the finest precision ever displayed.
+    return _format_hashrate_bucket(round(hashrate * 100))
+
 
+@lru_cache(maxsize=4096)
+def _format_hashrate_bucket(bucket: int) -> str:
+    hashrate = bucket / 100
+    scale, unit = (
+        (1_000_000, "MH/s") if hashrate >= 1_000_000 else (1_000, "kH/s") if hashrate >= 1_000 else (1, "H/s")
+    )
+    return f"{hashrate / scale:.2f} {unit}"
 
+
+@lru_cache(maxsize=4096)
 def format_uptime(seconds: int) -> str:
     """Return uptime in a readable format."""
     hours, remainder = divmod(seconds, 3600)
@@ -76,7 +185,89 @@ def format_uptime(seconds: int) -> str:
     return f"{int(hours):02d}:{int(minutes):02d}:{int(secs):02d}"
 
 
-class WalletSummaryPanel(QGroupBox):
+class StatePanel(QGroupBox):
+    """Group box whose AppState subscriptions are made once and torn down with it."""
+
+    # State signals can fire once per miner line; throttled slots repaint at
+    # most this often. Set to 0 (e.g. in tests) to deliver every emit directly.
+    UI_THROTTLE_MS = 100
+
+    def __init__(self, title: str, state: AppState) -> None:
+        super().__init__(title)
+        self.state = state
+        self._state_connections: list[tuple[SignalInstance, Callable[..., None]]] = []
+        self._throttled_slots: dict[Callable[..., None], Callable[..., None]] = {}
+        self._hidden_gates: dict[Callable[..., None], Callable[..., None]] = {}
+        self._hidden_pending: dict[Callable[..., None], tuple] = {}
+
+    def throttled(self, slot: Callable[..., None]) -> Callable[..., None]:
+        """Return ``slot`` rate-limited to ``UI_THROTTLE_MS``, reusing one throttler per slot."""
+        if self.UI_THROTTLE_MS <= 0:
+            return slot
+        throttler = self._throttled_slots.get(slot)
+        if throttler is None:
+            throttler = Throttler(slot, interval_ms=self.UI_THROTTLE_MS, parent=self)
+            self._throttled_slots[slot] = throttler
+        return throttler
+
+    def deferred_while_hidden(self, slot: Callable[..., None]) -> Callable[..., None]:
+        """Return ``slot`` gated on visibility; hidden calls keep only the latest arguments.
+
+        A minimized window leaves its children "visible", so that is checked too.
+        """
+        gate = self._hidden_gates.get(slot)
+        if gate is None:
+
+            def gate(*args: object) -> None:
+                if self.isVisible() and not self.window().isMinimized():
+                    slot(*args)
+                else:
+                    self._hidden_pending[slot] = args
+
+            self._hidden_gates[slot] = gate
+        return gate
+
+    def bind_state(
+        self,
+        signal: SignalInstance,
+        slot: Callable[..., None],
+        throttle: bool = False,
+        defer_hidden: bool = False,
+    ) -> None:
+        if throttle:
+            slot = self.throttled(slot)
+        if defer_hidden:
+            slot = self.deferred_while_hidden(slot)
+        # Skipping known pairs keeps a re-bound slot from running twice per emit;
+        # Qt's UniqueConnection does not cover plain callables like Throttler.
+        if any(bound == (signal, slot) for bound in self._state_connections):
+            return
+        signal.connect(slot)
+        self._state_connections.append((signal, slot))
+
+    def unbind_state(self) -> None:
+        for signal, slot in self._state_connections:
+            with suppress(RuntimeError):
+                signal.disconnect(slot)
+        self._state_connections.clear()
+        self._hidden_pending.clear()
+
+    def flush_deferred(self) -> None:
+        """Run the latest call each gated slot missed while the panel was hidden."""
+        pending, self._hidden_pending = self._hidden_pending, {}
+        for slot, args in pending.items():
+            slot(*args)
+
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        super().showEvent(event)
+        self.flush_deferred()
+
+    def deleteLater(self) -> None:
+        self.unbind_state()
+        super().deleteLater()
+
+
+class WalletSummaryPanel(StatePanel):
     """Shows wallet balances and payout data."""
 
     def __init__(
@@ -85,9 +276,12 @@ class WalletSummaryPanel(QGroupBox):
         on_edit_credentials: Callable[[], None],
         on_manual_refresh: Callable[..., None],
     ) -> None:
-        super().__init__("Wallet Summary")
-        self.state = state
-        self._worker: Optional[WalletWorker] = None
+        super().__init__("Wallet Summary", state)
+        self._last: dict[str, object] = {}
+        self._worker = WalletWorker(state)
+        self._worker.success.connect(self._on_success)
+        self._worker.error.connect(self._on_error)
+        self._pending_fetch: Optional[Future] = None
 
         layout = QFormLayout()
         self.username_label = QLabel("-")
@@ -95,7 +289,7 @@ class WalletSummaryPanel(QGroupBox):
         self.pending_label = QLabel("0 DUCO")
         self.last_payout_label = QLabel("N/A")
         self.error_label = QLabel("")
-        self.error_label.setStyleSheet("color: red;")
+        self.error_label.setPalette(_PALETTES["disconnected"])
         self.refresh_button = QPushButton("Refresh Wallet")
 
         layout.addRow("Username:", self.username_label)
@@ -116,37 +310,43 @@ class WalletSummaryPanel(QGroupBox):
         layout.addRow(button_row)
         self.setLayout(layout)
 
-        self.state.wallet_changed.connect(self.refresh)
+        self.bind_state(self.state.wallet_changed, self.refresh, throttle=True, defer_hidden=True)
         self.refresh_button.clicked.connect(self._refresh_wallet)
+
+    def populate(self) -> None:
         self.refresh(self.state.wallet)
 
     def refresh(self, wallet: WalletData) -> None:
-        self.username_label.setText(wallet.username or "-")
-        self.balance_label.setText(f"{wallet.balance:.4f} DUCO")
-        self.pending_label.setText(f"{wallet.pending_rewards:.4f} DUCO")
-        self.last_payout_label.setText(wallet.last_payout or "N/A")
-        self.error_label.setText("")
-
+        last = self._last
+        if _changed(last, "username", wallet.username):
+            self.username_label.setText(wallet.username or "-")
+        if _changed(last, "balance", wallet.balance):
+            self.balance_label.setText(f"{wallet.balance:.4f} DUCO")
+        if _changed(last, "pending", wallet.pending_rewards):
+            self.pending_label.setText(f"{wallet.pending_rewards:.4f} DUCO")
+        if _changed(last, "last_payout", wallet.last_payout):
+            self.last_payout_label.setText(wallet.last_payout or "N/A")
+        self.error_label.clear()
+
+    @Slot()
     def _refresh_wallet(self) -> None:
-        if self._worker and self._worker.isRunning():
+        if self._pending_fetch and not self._pending_fetch.done():
             return
         self.error_label.setText("Refreshing...")
-        self._worker = WalletWorker(self.state)
-        self._worker.success.connect(self._on_success)
-        self._worker.error.connect(self._on_error)
-        self._worker.finished.connect(self._worker.deleteLater)
-        self._worker.start()
+        self._pending_fetch = self._worker.fetch()
 
+    @Slot(WalletData)
     def _on_success(self, data: WalletData) -> None:
         self.state.set_wallet(data)
         self.error_label.setText("")
 
+    @Slot(str)
     def _on_error(self, message: str) -> None:
         self.error_label.setText(message)
         self.state.log_error(message)
 
 
-class CpuMinerPanel(QGroupBox):
+class CpuMinerPanel(StatePanel):
     """Controls and status for the CPU miner."""
 
     def __init__(
@@ -155,18 +355,20 @@ class CpuMinerPanel(QGroupBox):
         start_callback: Callable[[], None],
         stop_callback: Callable[[], None],
     ) -> None:
-        super().__init__("CPU Miner")
-        self.state = state
+        super().__init__("CPU Miner", state)
+        self._last: dict[str, object] = {}
         self._start_callback = start_callback
         self._stop_callback = stop_callback
 
         layout = QVBoxLayout()
         self.status_label = QLabel("Stopped")
         self.hashrate_label = QLabel("0.00 H/s")
+        _reserve_width(self.hashrate_label, "999.99 MH/s")
         self.shares_label = QLabel("0 accepted / 0 rejected")
         self.temp_label = QLabel("Temp: -")
+        _reserve_width(self.temp_label, "Temp: 100.0°C")
         self.connection_label = QLabel("Status: Connected")
-        self.connection_label.setStyleSheet("color: green;")
+        self.connection_label.setPalette(_PALETTES["running"])
 
         button_row = QHBoxLayout()
         self.start_button = QPushButton("Start CPU Miner")
@@ -188,47 +390,61 @@ class CpuMinerPanel(QGroupBox):
         self.stop_button.clicked.connect(self._handle_stop)
         self.restart_button.clicked.connect(self._handle_restart)
 
-        self.state.cpu_status_changed.connect(self.refresh)
+        self.bind_state(self.state.cpu_status_changed, self.refresh, throttle=True, defer_hidden=True)
+
+    def populate(self) -> None:
         self.refresh(self.state.cpu_status)
 
+    @Slot()
     def _handle_start(self) -> None:
         self._start_callback()
 
+    @Slot()
     def _handle_stop(self) -> None:
         self._stop_callback()
 
+    @Slot()
     def _handle_restart(self) -> None:
         self._stop_callback()
         self._start_callback()
         self.state.add_notification("CPU miner restarted", miner="CPU")
 
     def refresh(self, status: MinerStatus) -> None:
-        self.status_label.setText("Running" if status.running else "Stopped")
-        self.status_label.setStyleSheet(
-            "color: green;" if status.running else "color: #a00;"
-        )
-        self.hashrate_label.setText(format_hashrate(status.hashrate))
-        self.shares_label.setText(
-            f"{status.accepted_shares} accepted / {status.rejected_shares} rejected"
-        )
-        if status.temperature_c is None:
-            self.temp_label.setText("Temp: -")
-        else:
-            self.temp_label.setText(f"Temp: {status.temperature_c:.1f}°C")
+        last = self._last
+        # Dataclasses compare by value, so a repeated snapshot is one check.
+        if not _changed(last, "status", status):
+            return
+        if _changed(last, "running", status.running):
+            self.status_label.setText("Running" if status.running else "Stopped")
+            self.status_label.setPalette(_PALETTES["running" if status.running else "stopped"])
+            self.start_button.setEnabled(not status.running)
+            self.stop_button.setEnabled(status.running)
+        if _changed(last, "hashrate", status.hashrate):
+            self.hashrate_label.setText(format_hashrate(status.hashrate))
+        if _changed(last, "shares", (status.accepted_shares, status.rejected_shares)):
+            self.shares_label.setText(
+                f"{status.accepted_shares} accepted / {status.rejected_shares} rejected"
+            )
+        if _changed(last, "temperature", status.temperature_c):
+            if status.temperature_c is None:
+                self.temp_label.setText("Temp: -")
+            else:
+                self.temp_label.setText(f"Temp: {status.temperature_c:.1f}°C")
+        connection = (status.running, status.connected, status.last_error)
+        if not _changed(last, "connection", connection):
+            return
         if status.running and status.connected:
             self.connection_label.setText("Status: Connected")
-            self.connection_label.setStyleSheet("color: green;")
+            self.connection_label.setPalette(_PALETTES["running"])
         elif not status.running:
             self.connection_label.setText("Status: Stopped")
-            self.connection_label.setStyleSheet("color: gray;")
+            self.connection_label.setPalette(_PALETTES["idle"])
         else:
             self.connection_label.setText(status.last_error or "Status: Disconnected")
-            self.connection_label.setStyleSheet("color: red;")
-        self.start_button.setEnabled(not status.running)
-        self.stop_button.setEnabled(status.running)
+            self.connection_label.setPalette(_PALETTES["disconnected"])
 
 
-class GpuMinerPanel(QGroupBox):
+class GpuMinerPanel(StatePanel):
     """Controls and status for the GPU miner."""
 
     def __init__(
@@ -237,20 +453,22 @@ class GpuMinerPanel(QGroupBox):
         start_callback: Callable[[], None],
         stop_callback: Callable[[], None],
     ) -> None:
-        super().__init__("GPU Miner")
-        self.state = state
+        super().__init__("GPU Miner", state)
+        self._last: dict[str, object] = {}
         self._start_callback = start_callback
         self._stop_callback = stop_callback
 
         layout = QVBoxLayout()
         self.status_label = QLabel("Stopped")
         self.hashrate_label = QLabel("0.00 H/s")
+        _reserve_width(self.hashrate_label, "999.99 MH/s")
         self.shares_label = QLabel("0 accepted / 0 rejected")
         self.connection_label = QLabel("Status: Connected")
-        self.connection_label.setStyleSheet("color: green;")
+        self.connection_label.setPalette(_PALETTES["running"])
 
         devices_label = QLabel("Devices:")
         self.device_list = QListWidget()
+        self.device_list.setUniformItemSizes(True)
 
         button_row = QHBoxLayout()
         self.start_button = QPushButton("Start GPU Miner")
@@ -273,61 +491,90 @@ class GpuMinerPanel(QGroupBox):
         self.stop_button.clicked.connect(self._handle_stop)
         self.restart_button.clicked.connect(self._handle_restart)
 
-        self.state.gpu_status_changed.connect(self.refresh_status)
-        self.state.config_changed.connect(self.refresh_devices)
+        self.bind_state(self.state.gpu_status_changed, self.refresh_status, throttle=True, defer_hidden=True)
+        self.bind_state(self.state.config_changed, self.refresh_devices, defer_hidden=True)
 
+    def populate(self) -> None:
         self.refresh_status(self.state.gpu_status)
         self.refresh_devices(self.state.config)
 
+    @Slot()
     def _handle_start(self) -> None:
         self._start_callback()
 
+    @Slot()
     def _handle_stop(self) -> None:
         self._stop_callback()
 
+    @Slot()
     def _handle_restart(self) -> None:
         self._stop_callback()
         self._start_callback()
         self.state.add_notification("GPU miner restarted", miner="GPU")
 
     def refresh_status(self, status: MinerStatus) -> None:
-        self.status_label.setText("Running" if status.running else "Stopped")
-        self.status_label.setStyleSheet(
-            "color: green;" if status.running else "color: #a00;"
-        )
-        self.hashrate_label.setText(format_hashrate(status.hashrate))
-        self.shares_label.setText(
-            f"{status.accepted_shares} accepted / {status.rejected_shares} rejected"
-        )
+        last = self._last
+        # Dataclasses compare by value, so a repeated snapshot is one check.
+        if not _changed(last, "status", status):
+            return
+        if _changed(last, "running", status.running):
+            self.status_label.setText("Running" if status.running else "Stopped")
+            self.status_label.setPalette(_PALETTES["running" if status.running else "stopped"])
+            self.start_button.setEnabled(not status.running)
+            self.stop_button.setEnabled(status.running)
+        if _changed(last, "hashrate", status.hashrate):
+            self.hashrate_label.setText(format_hashrate(status.hashrate))
+        if _changed(last, "shares", (status.accepted_shares, status.rejected_shares)):
+            self.shares_label.setText(
+                f"{status.accepted_shares} accepted / {status.rejected_shares} rejected"
+            )
+        connection = (status.running, status.connected, status.last_error)
+        if not _changed(last, "connection", connection):
+            return
         if status.running and status.connected:
             self.connection_label.setText("Status: Connected")
-            self.connection_label.setStyleSheet("color: green;")
+            self.connection_label.setPalette(_PALETTES["running"])
         elif not status.running:
             self.connection_label.setText("Status: Stopped")
-            self.connection_label.setStyleSheet("color: gray;")
+            self.connection_label.setPalette(_PALETTES["idle"])
         else:
             self.connection_label.setText(status.last_error or "Status: Disconnected")
-            self.connection_label.setStyleSheet("color: red;")
-        self.start_button.setEnabled(not status.running)
-        self.stop_button.setEnabled(status.running)
+            self.connection_label.setPalette(_PALETTES["disconnected"])
 
     def refresh_devices(self, config: Configuration) -> None:
-        self.device_list.clear()
-        for device in config.gpu_devices:
-            QListWidgetItem(device, self.device_list)
-
-
-class LiveStatsPanel(QGroupBox):
+        devices = tuple(config.gpu_devices)
+        if not _changed(self._last, "devices", devices):
+            return
+        # Patch rows in place so selection and scroll position survive edits.
+        count = self.device_list.count()
+        for row, device in enumerate(devices[:count]):
+            item = self.device_list.item(row)
+            if item.text() != device:
+                item.setText(device)
+        if len(devices) > count:
+            self.device_list.addItems(list(devices[count:]))
+        elif len(devices) < count:
+            self.device_list.model().removeRows(len(devices), count - len(devices))
+
+
+class LiveStatsPanel(StatePanel):
     """Displays live mining statistics."""
 
     def __init__(self, state: AppState) -> None:
-        super().__init__("Live Stats")
-        self.state = state
+        super().__init__("Live Stats", state)
+        # Nothing reports ping yet; the label starts at "N/A", so None needs no update.
+        self._last: dict[str, object] = {"ping": None}
 
         layout = QFormLayout()
         self.uptime_label = QLabel(format_uptime(self.state.live_stats.uptime_seconds))
         self.hashes_label = QLabel(str(self.state.live_stats.total_hashes))
         self.difficulty_label = QLabel(f"{self.state.live_stats.difficulty:.4f}")
+        for label, sample in (
+            (self.uptime_label, format_uptime(999_999)),
+            (self.hashes_label, f"{999_999_999_999:,}"),
+            (self.difficulty_label, f"{99_999.0:.4f}"),
+        ):
+            _reserve_width(label, sample)
         self.ping_label = QLabel("N/A")
 
         layout.addRow("Uptime:", self.uptime_label)
@@ -336,58 +583,158 @@ class LiveStatsPanel(QGroupBox):
         layout.addRow("Ping:", self.ping_label)
         self.setLayout(layout)
 
-        self.state.stats_changed.connect(self.refresh)
+        self.bind_state(self.state.stats_changed, self.refresh, throttle=True, defer_hidden=True)
+
+    def populate(self) -> None:
         self.refresh(self.state.live_stats)
 
     def refresh(self, stats: LiveStats) -> None:
-        self.uptime_label.setText(format_uptime(stats.uptime_seconds))
-        self.hashes_label.setText(f"{stats.total_hashes:,}")
-        self.difficulty_label.setText(f"{stats.difficulty:.4f}")
-        self.ping_label.setText(f"{stats.ping_ms:.1f} ms" if stats.ping_ms else "N/A")
+        last = self._last
+        # Dataclasses compare by value, so a repeated snapshot is one check.
+        if not _changed(last, "stats", stats):
+            return
+        if _changed(last, "uptime", stats.uptime_seconds):
+            self.uptime_label.setText(format_uptime(stats.uptime_seconds))
+        if _changed(last, "hashes", stats.total_hashes):
+            self.hashes_label.setText(f"{stats.total_hashes:,}")
+        if _changed(last, "difficulty", stats.difficulty):
+            self.difficulty_label.setText(f"{stats.difficulty:.4f}")
+        if _changed(last, "ping", stats.ping_ms):
+            self.ping_label.setText(f"{stats.ping_ms:.1f} ms" if stats.ping_ms else "N/A")
 
 
 class GaugeWidget(QFrame):
-    """Simple colored gauge with a title and value label."""
+    """Simple colored gauge with a title and value label.
 
+    The state background is painted from a pixmap cached per state and size,
+    so changing state only swaps pixmaps instead of restyling the widget tree.
+    """
+
+    # state -> (background, border)
     STATES = {
-        "ok": "background-color: #e8f5e9; border: 1px solid #66bb6a;",
-        "warn": "background-color: #fff3e0; border: 1px solid #ffa726;",
-        "error": "background-color: #ffebee; border: 1px solid #ef5350;",
+        "ok": ("#e8f5e9", "#66bb6a"),
+        "warn": ("#fff3e0", "#ffa726"),
+        "error": ("#ffebee", "#ef5350"),
     }
 
     def __init__(self, title: str) -> None:
         super().__init__()
+        self._pixmaps: dict[str, QPixmap] = {}
+        self._state = "ok"
         layout = QVBoxLayout()
         self.title_label = QLabel(title)
         self.value_label = QLabel("-")
         self.detail_label = QLabel("")
-        self.title_label.setStyleSheet("font-weight: bold;")
+        _set_bold(self.title_label)
         layout.addWidget(self.title_label)
         layout.addWidget(self.value_label)
         layout.addWidget(self.detail_label)
         layout.addStretch(1)
         self.setLayout(layout)
         self.setFrameStyle(QFrame.Panel | QFrame.Raised)
-        self.set_state("ok")
+        self._value = "-"
+        self._detail = ""
 
     def set_state(self, state: str) -> None:
-        style = self.STATES.get(state, self.STATES["ok"])
-        self.setStyleSheet(style)
+        state = state if state in self.STATES else "ok"
+        if state == self._state:
+            return
+        self._state = state
+        self.update()
+
+    def _state_pixmap(self) -> QPixmap:
+        pixmap = self._pixmaps.get(self._state)
+        if pixmap is None:
+            ratio = self.devicePixelRatioF()
+            pixmap = QPixmap(self.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            background, border = self.STATES[self._state]
+            pixmap.fill(QColor(background))
+            painter = QPainter(pixmap)
+            painter.setPen(QPen(QColor(border), 1))
+            # Inset the state border so the QFrame panel frame stays visible around it.
+            inset = self.frameWidth()
+            painter.drawRect(self.rect().adjusted(inset, inset, -inset - 1, -inset - 1))
+            painter.end()
+            self._pixmaps[self._state] = pixmap
+        return pixmap
+
+    def resizeEvent(self, event) -> None:  # type: ignore[override]
+        self._pixmaps.clear()
+        super().resizeEvent(event)
+
+    def paintEvent(self, event) -> None:  # type: ignore[override]
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._state_pixmap())
+        self.drawFrame(painter)
+        painter.end()
 
     def update_value(self, value: str, detail: str = "", state: str = "ok") -> None:
-        self.value_label.setText(value)
-        self.detail_label.setText(detail)
+        # Only touch widgets whose content changed; restyling is the costly part.
+        if value != self._value:
+            self._value = value
+            self.value_label.setText(value)
+        if detail != self._detail:
+            self._detail = detail
+            self.detail_label.setText(detail)
         self.set_state(state)
 
 
-class MinerGaugesPanel(QGroupBox):
+_LOG_BRUSHES = {
+    "error": QBrush(Qt.red),
+    "warning": QBrush(Qt.darkYellow),
+    "info": QBrush(Qt.darkGreen),
+}
+
+
+class LogModel(QAbstractListModel):
+    """Bounded list model of miner log entries with pre-built row brushes."""
+
+    def __init__(self, max_rows: int, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._rows: deque[tuple[str, str]] = deque(maxlen=max_rows)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][1]
+        if role == Qt.ForegroundRole:
+            return _LOG_BRUSHES.get(self._rows[index.row()][0], _LOG_BRUSHES["info"])
+        return None
+
+    def extend(self, entries: Iterable[MinerLogEntry]) -> None:
+        rows = [(entry.level, f"[{entry.level.upper()}] {entry.message}") for entry in entries]
+        max_rows = self._rows.maxlen or len(rows)
+        rows = rows[-max_rows:]
+        if not rows:
+            return
+        overflow = min(len(self._rows) + len(rows) - max_rows, len(self._rows))
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self._rows.popleft()
+            self.endRemoveRows()
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+
+class MinerGaugesPanel(StatePanel):
     """Dashboard gauges fed by live miner metrics."""
 
+    MAX_LOG_ITEMS = 200
+    LOG_FLUSH_MS = 50
+
     def __init__(self, state: AppState, miner_type: str = "cpu") -> None:
-        super().__init__("Miner Gauges")
-        self.state = state
+        super().__init__("Miner Gauges", state)
         self.miner_type = miner_type
-        self.metrics = MinerMetrics()
+        self.metrics = DEFAULT_METRICS
+        self._last: dict[str, object] = {}
 
         gauges_row = QHBoxLayout()
         self.hashrate_gauge = GaugeWidget("Hashrate")
@@ -400,10 +747,22 @@ class MinerGaugesPanel(QGroupBox):
         gauges_row.addWidget(self.rewards_gauge)
 
         self.alert_label = QLabel("")
-        self.alert_label.setStyleSheet("color: #ef5350; font-weight: bold;")
-
-        self.log_list = QListWidget()
+        self.alert_label.setPalette(_PALETTES["alert"])
+        _set_bold(self.alert_label)
+
+        self.log_model = LogModel(self.MAX_LOG_ITEMS, self)
+        self.log_list = QListView()
+        self.log_list.setModel(self.log_model)
+        self.log_list.setUniformItemSizes(True)
+        # Lay out long scrollback in chunks instead of all rows up front.
+        self.log_list.setLayoutMode(QListView.Batched)
+        self.log_list.setBatchSize(50)
         self.log_list.setMaximumHeight(150)
+        self._log_buffer: deque[MinerLogEntry] = deque(maxlen=self.MAX_LOG_ITEMS)
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(self.LOG_FLUSH_MS)
+        self._log_flush_timer.timeout.connect(self._flush_logs)
 
         layout = QVBoxLayout()
         layout.addLayout(gauges_row)
@@ -412,58 +771,63 @@ class MinerGaugesPanel(QGroupBox):
         layout.addWidget(self.log_list)
         self.setLayout(layout)
 
-        self.state.metrics_changed.connect(self._on_metrics_changed)
-        self.state.log_added.connect(self._on_log_added)
+        # Throttled here rather than in bind_state so CPU and GPU metrics
+        # are filtered before they can collapse into one trailing call.
+        self._throttled_refresh = self.throttled(self.refresh)
+        self.bind_state(self.state.metrics_changed, self._on_metrics_changed)
+        self.bind_state(self.state.log_added, self._on_log_added)
 
-        self.refresh(self.state.metrics.get(self.miner_type, MinerMetrics()))
-        self._start_refresh_timer()
-
-    def _start_refresh_timer(self) -> None:
-        timer = QTimer(self)
-        timer.setInterval(1000)
-        timer.timeout.connect(self._refresh_from_state)
-        timer.start()
-        self.timer = timer
-
-    def _refresh_from_state(self) -> None:
-        self.refresh(self.state.metrics.get(self.miner_type, MinerMetrics()))
+    def populate(self) -> None:
+        self.refresh(self.state.metrics.get(self.miner_type, DEFAULT_METRICS))
 
+    @Slot(str, MinerMetrics)
     def _on_metrics_changed(self, miner_type: str, metrics: MinerMetrics) -> None:
         if miner_type == self.miner_type:
-            self.refresh(metrics)
+            self._throttled_refresh(metrics)
 
+    @Slot(MinerLogEntry)
     def _on_log_added(self, entry: MinerLogEntry) -> None:
-        item = QListWidgetItem(f"[{entry.level.upper()}] {entry.message}")
-        if entry.level == "error":
-            item.setForeground(Qt.red)
-        elif entry.level == "warning":
-            item.setForeground(Qt.darkYellow)
-        else:
-            item.setForeground(Qt.darkGreen)
-        self.log_list.addItem(item)
+        self._log_buffer.append(entry)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    @Slot()
+    def _flush_logs(self) -> None:
+        """Append buffered log entries in one pass so a burst costs one scroll."""
+        if not self._log_buffer:
+            return
+        entries = list(self._log_buffer)
+        self._log_buffer.clear()
+        self.log_model.extend(entries)
         self.log_list.scrollToBottom()
-        if self.log_list.count() > 200:
-            self.log_list.takeItem(0)
 
     def refresh(self, metrics: MinerMetrics) -> None:
         self.metrics = metrics
-
-        hashrate_state = "ok" if metrics.hashrate > 0 else "warn"
-        self.hashrate_gauge.update_value(format_hashrate(metrics.hashrate), "", hashrate_state)
-
-        share_state = "ok" if metrics.share_rate_per_min > 0 else "warn"
-        if metrics.rejected_shares > 0:
-            share_state = "warn"
-        self.share_rate_gauge.update_value(f"{metrics.share_rate_per_min:.2f} / min", "", share_state)
-
-        temp_detail = "-" if metrics.temperature_c is None else f"{metrics.temperature_c:.1f} °C"
-        temp_state = "ok"
-        if metrics.temperature_c is not None:
-            if metrics.temperature_c >= 85:
-                temp_state = "error"
-            elif metrics.temperature_c >= 75:
-                temp_state = "warn"
-        self.temperature_gauge.update_value(temp_detail, state=temp_state)
+        last = self._last
+
+        if _changed(last, "hashrate", metrics.hashrate):
+            hashrate_state = "ok" if metrics.hashrate > 0 else "warn"
+            self.hashrate_gauge.update_value(format_hashrate(metrics.hashrate), "", hashrate_state)
+
+        if _changed(last, "share_rate", (metrics.share_rate_per_min, metrics.rejected_shares)):
+            share_state = "ok" if metrics.share_rate_per_min > 0 else "warn"
+            if metrics.rejected_shares > 0:
+                share_state = "warn"
+            self.share_rate_gauge.update_value(f"{metrics.share_rate_per_min:.2f} / min", "", share_state)
+
+        if _changed(last, "temperature", metrics.temperature_c):
+            temp_detail = "-" if metrics.temperature_c is None else f"{metrics.temperature_c:.1f} °C"
+            temp_state = "ok"
+            if metrics.temperature_c is not None:
+                if metrics.temperature_c >= 85:
+                    temp_state = "error"
+                elif metrics.temperature_c >= 75:
+                    temp_state = "warn"
+            self.temperature_gauge.update_value(temp_detail, state=temp_state)
+
+        alert_inputs = (metrics.projected_duco_per_day, metrics.last_error, metrics.rejected_shares)
+        if not _changed(last, "alert", alert_inputs):
+            return
 
         reward_state = "ok"
         if metrics.last_error:
@@ -478,12 +842,12 @@ class MinerGaugesPanel(QGroupBox):
         self.alert_label.setText(alert_text)
 
 
-class SettingsPanel(QGroupBox):
+class SettingsPanel(StatePanel):
     """Shows configuration summary and opens the settings dialog."""
 
     def __init__(self, state: AppState) -> None:
-        super().__init__("Settings")
-        self.state = state
+        super().__init__("Settings", state)
+        self._last: dict[str, object] = {}
 
         layout = QFormLayout()
         self.cpu_threads_label = QLabel("-")
@@ -505,20 +869,31 @@ class SettingsPanel(QGroupBox):
         layout.addRow(self.edit_button)
         self.setLayout(layout)
 
-        self.state.config_changed.connect(self.refresh)
+        self.bind_state(self.state.config_changed, self.refresh, defer_hidden=True)
+
+    def populate(self) -> None:
         self.refresh(self.state.config)
 
+    @Slot()
     def _open_dialog(self) -> None:
         dialog = SettingsDialog(self.state)
         dialog.exec()
 
     def refresh(self, config: Configuration) -> None:
-        self.cpu_threads_label.setText(str(config.cpu_threads))
-        self.intensity_label.setText(str(config.intensity))
-        self.server_label.setText(f"{config.server}:{config.port}")
-        self.refresh_label.setText(f"Every {config.refresh_interval} s")
-        self.theme_label.setText(config.theme.title())
-        self.auto_start_label.setText("Yes" if config.auto_start else "No")
+        last = self._last
+        if _changed(last, "cpu_threads", config.cpu_threads):
+            self.cpu_threads_label.setText(str(config.cpu_threads))
+        if _changed(last, "intensity", config.intensity):
+            self.intensity_label.setText(str(config.intensity))
+        if _changed(last, "server", (config.server, config.port)):
+            self.server_label.setText(f"{config.server}:{config.port}")
+        if _changed(last, "refresh_interval", (config.refresh_interval, config.adaptive_refresh)):
+            suffix = " (adaptive)" if config.adaptive_refresh else ""
+            self.refresh_label.setText(f"Every {config.refresh_interval} s{suffix}")
+        if _changed(last, "theme", config.theme):
+            self.theme_label.setText(config.theme.title())
+        if _changed(last, "auto_start", config.auto_start):
+            self.auto_start_label.setText("Yes" if config.auto_start else "No")
 
 
 class SettingsDialog(QDialog):
@@ -531,44 +906,29 @@ class SettingsDialog(QDialog):
 
         form = QFormLayout()
         self.cpu_threads = QSpinBox()
-        self.cpu_threads.setMinimum(1)
-        self.cpu_threads.setMaximum(512)
-        self.cpu_threads.setValue(state.config.cpu_threads)
-
+        self.cpu_threads.setRange(1, 512)
         self.intensity = QSpinBox()
-        self.intensity.setMinimum(1)
-        self.intensity.setMaximum(100)
-        self.intensity.setValue(state.config.intensity)
-
-        self.server = QLineEdit(state.config.server)
-
+        self.intensity.setRange(1, 100)
+        self.server = QLineEdit()
         self.port = QSpinBox()
-        self.port.setMinimum(1)
-        self.port.setMaximum(65535)
-        self.port.setValue(state.config.port)
-
+        self.port.setRange(1, 65535)
         self.refresh_interval = QSpinBox()
-        self.refresh_interval.setMinimum(1)
-        self.refresh_interval.setMaximum(3600)
-        self.refresh_interval.setValue(state.config.refresh_interval)
-
+        self.refresh_interval.setRange(1, 3600)
         self.theme = QComboBox()
         for name in sorted(THEMES):
             self.theme.addItem(name.title(), name)
-        current_index = self.theme.findData(state.config.theme.lower())
-        self.theme.setCurrentIndex(max(0, current_index))
-
         self.auto_start = QCheckBox("Start miners on launch")
-        self.auto_start.setChecked(state.config.auto_start)
-
-        self.gpu_devices = QLineEdit(", ".join(state.config.gpu_devices))
+        self.adaptive_refresh = QCheckBox("Refresh wallet less often while it is unchanged")
+        self.gpu_devices = QLineEdit()
         self.gpu_devices.setPlaceholderText("GPU 0, GPU 1")
+        self._load_values(state.config)
 
         form.addRow("CPU threads:", self.cpu_threads)
         form.addRow("Intensity:", self.intensity)
         form.addRow("Server host:", self.server)
         form.addRow("Port:", self.port)
         form.addRow("Refresh interval (s):", self.refresh_interval)
+        form.addRow(self.adaptive_refresh)
         form.addRow("Theme:", self.theme)
         form.addRow("GPU devices:", self.gpu_devices)
         form.addRow(self.auto_start)
@@ -582,18 +942,50 @@ class SettingsDialog(QDialog):
         layout.addWidget(buttons)
         self.setLayout(layout)
 
+    def _load_values(self, config: Configuration) -> None:
+        editors = (
+            self.cpu_threads,
+            self.intensity,
+            self.server,
+            self.port,
+            self.refresh_interval,
+            self.theme,
+            self.auto_start,
+            self.adaptive_refresh,
+            self.gpu_devices,
+        )
+        # Filling the form must not look like user edits to anything listening.
+        with _batch_updates(*editors):
+            self.cpu_threads.setValue(config.cpu_threads)
+            self.intensity.setValue(config.intensity)
+            if self.server.text() != config.server:
+                self.server.setText(config.server)
+            self.port.setValue(config.port)
+            self.refresh_interval.setValue(config.refresh_interval)
+            self.theme.setCurrentIndex(max(0, self.theme.findData(config.theme.lower())))
+            self.auto_start.setChecked(config.auto_start)
+            self.adaptive_refresh.setChecked(config.adaptive_refresh)
+            devices = ", ".join(config.gpu_devices)
+            if self.gpu_devices.text() != devices:
+                self.gpu_devices.setText(devices)
+
     def _collect_config(self) -> Configuration:
-        devices = [d.strip() for d in self.gpu_devices.text().split(",") if d.strip()]
-        candidate = replace(
-            self.state.config,
-            cpu_threads=self.cpu_threads.value(),
-            intensity=self.intensity.value(),
-            server=self.server.text(),
-            port=self.port.value(),
-            refresh_interval=self.refresh_interval.value(),
-            theme=self.theme.currentData(),
-            auto_start=self.auto_start.isChecked(),
-            gpu_devices=devices,
+        devices = GPU_DEVICE_PATTERN.findall(self.gpu_devices.text())
+        # Start from the current fields so ones this dialog does not edit
+        # (wallet credentials included) carry over, then list the edited ones.
+        candidate = Configuration(
+            **{
+                **config_to_dict(self.state.config),
+                "cpu_threads": self.cpu_threads.value(),
+                "gpu_devices": devices,
+                "intensity": self.intensity.value(),
+                "server": self.server.text(),
+                "port": self.port.value(),
+                "auto_start": self.auto_start.isChecked(),
+                "refresh_interval": self.refresh_interval.value(),
+                "adaptive_refresh": self.adaptive_refresh.isChecked(),
+                "theme": self.theme.currentData(),
+            }
         )
         return validate_config(candidate)
 
@@ -608,6 +1000,7 @@ class SettingsDialog(QDialog):
             ]
         )
 
+    @Slot()
     def _handle_accept(self) -> None:
         try:
             new_config = self._collect_config()
@@ -633,86 +1026,228 @@ class SettingsDialog(QDialog):
         self.accept()
 
 
-class NotificationPanel(QGroupBox):
+class NotificationPanel(StatePanel):
     """Displays notifications about miner health and API errors."""
 
+    MAX_ITEMS = 500
+    HIGH_WATER = 1000
+    FLUSH_MS = 100
+
     def __init__(self, state: AppState) -> None:
-        super().__init__("Notifications")
-        self.state = state
+        super().__init__("Notifications", state)
 
         layout = QVBoxLayout()
         self.list_widget = QListWidget()
+        # Every row is a single line of text, so Qt can skip measuring each item.
+        self.list_widget.setUniformItemSizes(True)
         layout.addWidget(self.list_widget)
         self.setLayout(layout)
 
-        self.state.notification_added.connect(self._add_entry)
-        for entry in self.state.notifications:
-            self._append_item(entry)
+        self._pending: deque[NotificationEntry] = deque(maxlen=self.MAX_ITEMS)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush)
+
+        self.bind_state(self.state.notification_added, self._add_entry)
+
+    def populate(self) -> None:
+        self._pending.extend(self.state.notifications)
+        self._flush()
 
+    @Slot(NotificationEntry)
     def _add_entry(self, entry: NotificationEntry) -> None:
-        self._append_item(entry)
+        self._pending.append(entry)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @Slot()
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        lines = [self._format_entry(entry) for entry in self._pending]
+        self._pending.clear()
+
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.addItems(lines)
+        count = self.list_widget.count()
+        if count > self.HIGH_WATER:
+            self.list_widget.model().removeRows(0, count - self.MAX_ITEMS)
+        self.list_widget.setUpdatesEnabled(True)
         self.list_widget.scrollToBottom()
 
-    def _append_item(self, entry: NotificationEntry) -> None:
+    @staticmethod
+    def _format_entry(entry: NotificationEntry) -> str:
         timestamp = time.strftime("%H:%M:%S", time.localtime(entry.timestamp))
         prefix = entry.severity.upper()
         miner = f" ({entry.miner})" if entry.miner else ""
-        QListWidgetItem(f"[{timestamp}] {prefix}{miner}: {entry.message}", self.list_widget)
+        return f"[{timestamp}] {prefix}{miner}: {entry.message}"
 
 
 class DiagnosticsPanel(QGroupBox):
     """Shows diagnostic logs and allows refresh without leaving the app."""
 
+    MAX_LOG_BLOCKS = 2000
+
     def __init__(self, state: AppState) -> None:
         super().__init__("Diagnostics")
         self.state = state
+        self._last_offset = 0
 
         layout = QVBoxLayout()
         self.log_view = QPlainTextEdit()
         self.log_view.setReadOnly(True)
+        self.log_view.setMaximumBlockCount(self.MAX_LOG_BLOCKS)
+        self.log_view.setPlaceholderText("No log entries yet.")
         self.refresh_button = QPushButton("Refresh Log")
 
         layout.addWidget(self.log_view)
         layout.addWidget(self.refresh_button)
         self.setLayout(layout)
 
+        # Log writes arrive in bursts; read the new tail at most a few times a second.
+        self._throttled_refresh = Throttler(self.refresh, interval_ms=250, parent=self)
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_log_file_changed)
+        self._watch_log_file()
+
         self.refresh_button.clicked.connect(self.refresh)
+
+    def populate(self) -> None:
         self.refresh()
 
+    def _watch_log_file(self) -> None:
+        path = str(self.state.log_path)
+        if path not in self._watcher.files() and self.state.log_path.exists():
+            self._watcher.addPath(path)
+
+    @Slot(str)
+    def _on_log_file_changed(self, _path: str) -> None:
+        # Rotation renames the file, which drops it from the watcher.
+        self._watch_log_file()
+        self._throttled_refresh()
+
     def refresh(self) -> None:
-        self.log_view.setPlainText(self.state.read_log_tail())
+        text, offset = self.state.read_log_tail_since(self._last_offset)
+        if offset < self._last_offset:
+            self.log_view.clear()
+        self._last_offset = offset
+        if text:
+            self.log_view.appendPlainText(text.rstrip("\n"))
 
 
 class HealthMonitor(QObject):
-    """Detects miner crashes or disconnects and notifies the user."""
+    """Detects miner crashes or disconnects and notifies the user.
+
+    Status changes re-arm a single coarse timer for the earliest heartbeat
+    deadline, so nothing wakes up while no miner is running.
+    """
 
-    def __init__(self, state: AppState, timeout_seconds: int = 10, interval_ms: int = 3000) -> None:
+    def __init__(
+        self,
+        state: AppState,
+        timeout_seconds: int = 10,
+        process_manager: Optional[MinerProcessManager] = None,
+    ) -> None:
         super().__init__()
         self.state = state
+        self.process_manager = process_manager
         self.timeout_seconds = timeout_seconds
+        self._connected = {"CPU": True, "GPU": True}
         self.timer = QTimer(self)
-        self.timer.setInterval(interval_ms)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.CoarseTimer)
         self.timer.timeout.connect(self._check_health)
 
     def start(self) -> None:
-        self.timer.start()
+        self.state.cpu_status_changed.connect(self._on_cpu_status, Qt.UniqueConnection)
+        self.state.gpu_status_changed.connect(self._on_gpu_status, Qt.UniqueConnection)
+        self._schedule()
+
+    @Slot(MinerStatus)
+    def _on_cpu_status(self, status: MinerStatus) -> None:
+        self._on_status("CPU", status, self.state.update_cpu_status)
+
+    @Slot(MinerStatus)
+    def _on_gpu_status(self, status: MinerStatus) -> None:
+        self._on_status("GPU", status, self.state.update_gpu_status)
+
+    def _on_status(self, miner_name: str, status: MinerStatus, updater: Callable[..., None]) -> None:
+        was_connected = self._connected[miner_name]
+        self._connected[miner_name] = status.connected
+        if status.running and not status.connected and was_connected:
+            self.state.log_error(f"{miner_name} miner lost connection.")
+            if not status.last_error:
+                updater(connected=False, last_error="Lost connection")
+        self._schedule()
+
+    def _schedule(self) -> None:
+        deadlines = [
+            status.last_heartbeat + self.timeout_seconds
+            for status in (self.state.cpu_status, self.state.gpu_status)
+            if status.running and status.last_heartbeat
+        ]
+        if not deadlines:
+            self.timer.stop()
+            return
+        delay_ms = max(0, int((min(deadlines) - time.time()) * 1000))
+        self.timer.start(delay_ms)
 
+    @Slot()
     def _check_health(self) -> None:
         now = time.time()
-        for miner_name, status, updater in [
-            ("CPU", self.state.cpu_status, self.state.update_cpu_status),
-            ("GPU", self.state.gpu_status, self.state.update_gpu_status),
+        manager = self.process_manager
+        for miner_name, status, updater, is_alive in [
+            ("CPU", self.state.cpu_status, self.state.update_cpu_status, manager and manager.is_cpu_running),
+            ("GPU", self.state.gpu_status, self.state.update_gpu_status, manager and manager.is_gpu_running),
         ]:
             if status.running and status.last_heartbeat and now - status.last_heartbeat > self.timeout_seconds:
+                if is_alive and is_alive():
+                    # A quiet miner whose process is still up is not dead.
+                    updater(last_heartbeat=now)
+                    continue
                 updater(running=False, connected=False, last_error="Miner unresponsive")
                 self.state.log_error(f"{miner_name} miner stopped responding; stopped for safety.")
-            elif status.running and not status.connected:
-                updater(last_error=status.last_error or "Lost connection")
-                self.state.log_error(f"{miner_name} miner lost connection.")
+        self._schedule()
+
+
+class _FetchSignals(QObject):
+    finished = Signal(object, object)
+
+
+class WalletFetchRunnable(QRunnable):
+    """Run a wallet call on the global QThreadPool and report back through a signal.
+
+    ``signals.finished`` carries the caller's ``tag`` and the completed future;
+    it is emitted from the pool thread, so GUI-thread receivers get a queued call.
+    """
+
+    def __init__(self, fn: Callable[..., object], *args: object, tag: object = None) -> None:
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.tag = tag
+        self.future: Future = Future()
+        self.signals = _FetchSignals()
+
+    def run(self) -> None:
+        if not self.future.set_running_or_notify_cancel():
+            return
+        try:
+            result = self.fn(*self.args)
+        except Exception as exc:
+            self.future.set_exception(exc)
+        else:
+            self.future.set_result(result)
+        self.signals.finished.emit(self.tag, self.future)
 
+    def start(self) -> Future:
+        QThreadPool.globalInstance().start(self)
+        return self.future
 
-class WalletWorker(QThread):
-    """Fetch wallet data with retry/backoff without blocking the UI."""
+
+class WalletWorker(QObject):
+    """Fetch wallet data with retry/backoff on the shared thread pool."""
 
     success = Signal(WalletData)
     error = Signal(str)
@@ -723,14 +1258,18 @@ class WalletWorker(QThread):
         self.max_attempts = 3
         self.base_backoff = 1.0
 
+    def fetch(self) -> Future:
+        """Schedule a fetch; results arrive through the success/error signals."""
+        return WalletFetchRunnable(self.run).start()
+
     def run(self) -> None:
         endpoint = f"https://{self.state.config.server}:{self.state.config.port}/wallet"
         last_error = ""
         for attempt in range(1, self.max_attempts + 1):
             try:
-                response = requests.get(endpoint, timeout=5)
+                response = _SESSION.get(endpoint, timeout=REQUEST_TIMEOUT)
                 response.raise_for_status()
-                payload = response.json()
+                payload = load_json(response.content)
                 wallet = WalletData(
                     username=payload.get("username", ""),
                     balance=float(payload.get("balance", 0.0)),
@@ -753,24 +1292,171 @@ class WalletWorker(QThread):
             self.error.emit(last_error)
 
 
+class WalletStreamWorker(QObject):
+    """Receive pushed wallet updates over the server-sent event stream.
+
+    The stream is read on a daemon thread that keeps this object alive until
+    it returns, so shutting down never waits on, or destroys, a blocked read.
+    Signals are emitted from that thread; GUI receivers get queued calls.
+    """
+
+    connected = Signal()
+    updated = Signal(WalletData)
+    unavailable = Signal()
+    disconnected = Signal(str)
+
+    def __init__(self, client: WalletClient, credentials: WalletCredentials) -> None:
+        super().__init__()
+        self.client = client
+        self.credentials = credentials
+        self._stopped = threading.Event()
+        self._response: Optional[requests.Response] = None
+
+    def start(self) -> None:
+        threading.Thread(target=self._run, name="wallet-stream", daemon=True).start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        response = self._response
+        # Closing the response unblocks a pending read in _run where it can.
+        if response is not None:
+            response.close()
+
+    def _run(self) -> None:
+        announced = False
+        try:
+            while not self._stopped.is_set():
+                self._response = self.client.open_wallet_stream(self.credentials)
+                if self._stopped.is_set():
+                    return
+                if not announced:
+                    announced = True
+                    self.connected.emit()
+                try:
+                    # Keep-alive lines come through as None, so a stop is seen on every line.
+                    for wallet in self.client.iter_wallet_events(self._response, self.credentials):
+                        if self._stopped.is_set():
+                            return
+                        if wallet is not None:
+                            self.updated.emit(wallet)
+                except WalletStreamTimeout:
+                    # A quiet connection past the short read timeout: reconnect silently.
+                    continue
+                finally:
+                    self._response.close()
+                if not self._stopped.is_set():
+                    self.disconnected.emit("Wallet event stream closed by server")
+                return
+        except WalletStreamUnavailable:
+            if not self._stopped.is_set():
+                self.unavailable.emit()
+        except (requests.RequestException, WalletClientError, ValueError) as exc:
+            if not self._stopped.is_set():
+                self.disconnected.emit(str(exc))
+
+
+class MinerParserWorker(QObject):
+    """Parse batches of miner stdout lines on a background thread."""
+
+    parsed = Signal(list)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.parsers = {"cpu": MinerMetricsParser(), "gpu": MinerMetricsParser()}
+
+    @Slot(list)
+    def parse_lines(self, lines: list) -> None:
+        by_miner: dict[str, list[str]] = {}
+        for miner_type, line in lines:
+            if miner_type in self.parsers:
+                by_miner.setdefault(miner_type, []).append(line)
+        results = [
+            (miner_type, *self.parsers[miner_type].parse_lines(miner_lines))
+            for miner_type, miner_lines in by_miner.items()
+        ]
+        if results:
+            self.parsed.emit(results)
+
+
+class ConfigSaver(QObject):
+    """Coalesce bursts of config changes and write them off the GUI thread."""
+
+    DELAY_MS = 500
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._pending: Optional[Configuration] = None
+        self._write_lock = threading.Lock()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.CoarseTimer)
+        self._timer.setInterval(self.DELAY_MS)
+        self._timer.timeout.connect(self._write_async)
+
+    @Slot(Configuration)
+    def schedule(self, config: Configuration) -> None:
+        self._pending = config
+        self._timer.start()
+
+    @Slot()
+    def flush(self) -> None:
+        """Write any pending config synchronously, e.g. before the app exits."""
+        self._timer.stop()
+        config, self._pending = self._pending, None
+        if config is not None:
+            self._write(config)
+
+    @Slot()
+    def _write_async(self) -> None:
+        config, self._pending = self._pending, None
+        if config is not None:
+            QThreadPool.globalInstance().start(lambda: self._write(config))
+
+    def _write(self, config: Configuration) -> None:
+        # Serialize writers so an exit-time flush never interleaves with a pool write.
+        with self._write_lock:
+            save_config(config)
+
+
 class AppWindow(QMainWindow):
     """Main application window that wires together panels and state."""
 
+    MINER_LINE_BATCH_MS = 50
+
+    _miner_lines_ready = Signal(list)
+
     def __init__(self, state: AppState) -> None:
         super().__init__()
         self.state = state
-        self.parsers = {"cpu": MinerMetricsParser(), "gpu": MinerMetricsParser()}
-        self.wallet_client = WalletClient(server=self.state.config.server)
-        self._wallet_executor = ThreadPoolExecutor(max_workers=1)
-        self._inflight_wallet_future: Future | None = None
-        self.process_manager = MinerProcessManager()
+        # Regex parsing of miner output runs on its own thread; results are
+        # applied to AppState back on the GUI thread in batches.
+        self._pending_miner_lines: deque[tuple[str, str]] = deque()
+        self._miner_line_timer = QTimer(self)
+        self._miner_line_timer.setSingleShot(True)
+        self._miner_line_timer.setInterval(self.MINER_LINE_BATCH_MS)
+        self._miner_line_timer.timeout.connect(self._flush_miner_lines)
+        self._parser_thread = QThread(self)
+        self._parser_worker = MinerParserWorker()
+        self._parser_worker.moveToThread(self._parser_thread)
+        self._parser_thread.finished.connect(self._parser_worker.deleteLater)
+        self._miner_lines_ready.connect(self._parser_worker.parse_lines)
+        self._parser_worker.parsed.connect(self._apply_parsed_output)
+        self._parser_thread.start()
+        # All wallet traffic shares the pooled session so keep-alive/TLS sessions are reused.
+        self.wallet_client = WalletClient(server=self.state.config.server, session=_SESSION)
+        self._wallet_cache = WalletCache(_wallet_cache_ttl(self.state.config.refresh_interval))
+        self.process_manager = MinerProcessManager(self)
         self.setWindowTitle("Duino Coin")
-        self.health_monitor = HealthMonitor(self.state)
+        self.health_monitor = HealthMonitor(self.state, process_manager=self.process_manager)
 
         central = QWidget()
+        # Build every panel before the first layout/paint pass.
+        central.setUpdatesEnabled(False)
         layout = QVBoxLayout()
         self.wallet_panel = WalletSummaryPanel(
-            self.state, self._open_wallet_dialog, self.refresh_wallet_data
+            self.state,
+            self._open_wallet_dialog,
+            self.refresh_wallet_data,
         )
         self.cpu_panel = CpuMinerPanel(
             self.state,
@@ -789,7 +1475,7 @@ class AppWindow(QMainWindow):
         self.notification_panel = NotificationPanel(self.state)
         self.diagnostics_panel = DiagnosticsPanel(self.state)
 
-        for widget in [
+        self.panels = [
             self.wallet_panel,
             self.cpu_panel,
             self.gpu_panel,
@@ -799,52 +1485,88 @@ class AppWindow(QMainWindow):
             self.settings_panel,
             self.notification_panel,
             self.diagnostics_panel,
-        ]:
+        ]
+        for widget in self.panels:
             layout.addWidget(widget)
         layout.addStretch(1)
         central.setLayout(layout)
         self.setCentralWidget(central)
-
+        for panel in self.panels:
+            panel.populate()
+        central.setUpdatesEnabled(True)
+
+        self._refresh_schedule = AdaptiveRefreshInterval(self.state.config.refresh_interval)
+        self._wallet_stream: Optional[WalletStreamWorker] = None
+        self._wallet_stream_key: Optional[tuple] = None
+        self._wallet_stream_live = False
+        self._refresh_paused = False
+        self._wallet_stream_unavailable: Optional[tuple] = None
+        self._wallet_stream_retry = QTimer(self)
+        self._wallet_stream_retry.setSingleShot(True)
+        self._wallet_stream_retry.setTimerType(Qt.CoarseTimer)
+        self._wallet_stream_retry.setInterval(WALLET_STREAM_RETRY_MS)
+        self._wallet_stream_retry.timeout.connect(self._start_wallet_stream)
         self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        # UI polling tolerates a few percent of jitter; avoid high-resolution OS timers.
+        self.refresh_timer.setTimerType(Qt.CoarseTimer)
         self.refresh_timer.setInterval(self.state.config.refresh_interval * 1000)
-        self.refresh_timer.timeout.connect(self.refresh_wallet_data)
+        self.refresh_timer.timeout.connect(self._on_refresh_timer)
 
         self.state.config_changed.connect(self._handle_config_changed)
 
         self._seed_default_state()
         self.health_monitor.start()
-        self.refresh_timer.start()
+        if self.state.config.wallet_username:
+            self.refresh_timer.start()
         self.refresh_wallet_data(force=True)
-        self.status_timer = QTimer(self)
-        self.status_timer.setInterval(1_000)
-        self.status_timer.timeout.connect(self._sync_process_states)
-        self.status_timer.start()
+        self._start_wallet_stream()
+        self.process_manager.cpu_state_changed.connect(self._on_cpu_process_state)
+        self.process_manager.gpu_state_changed.connect(self._on_gpu_process_state)
+        self.process_manager.cpu_output.connect(self._on_cpu_output)
+        self.process_manager.gpu_output.connect(self._on_gpu_output)
 
         QApplication.instance().aboutToQuit.connect(self.process_manager.stop_all)
+        QApplication.instance().applicationStateChanged.connect(self._on_application_state)
 
-    def _sync_process_states(self) -> None:
-        cpu_running = self.process_manager.is_cpu_running()
-        gpu_running = self.process_manager.is_gpu_running()
-        if self.state.cpu_status.running != cpu_running:
-            self.state.update_cpu_status(running=cpu_running)
-        if self.state.gpu_status.running != gpu_running:
-            self.state.update_gpu_status(running=gpu_running)
+    @Slot(bool)
+    def _on_cpu_process_state(self, running: bool) -> None:
+        if self.state.cpu_status.running == running:
+            return
+        if running:
+            self.state.update_cpu_status(running=True)
+        else:
+            self.state.update_cpu_status(running=False, hashrate=0.0)
+
+    @Slot(bool)
+    def _on_gpu_process_state(self, running: bool) -> None:
+        if self.state.gpu_status.running == running:
+            return
+        if running:
+            self.state.update_gpu_status(running=True)
+        else:
+            self.state.update_gpu_status(running=False, hashrate=0.0)
+
+    @Slot(list)
+    def _on_cpu_output(self, lines: list) -> None:
+        self.process_miner_lines("cpu", lines)
+
+    @Slot(list)
+    def _on_gpu_output(self, lines: list) -> None:
+        self.process_miner_lines("gpu", lines)
 
+    # The process manager's *_state_changed signals update AppState.
     def _start_cpu_miner(self) -> None:
-        started = self.process_manager.start_cpu_miner()
-        self.state.update_cpu_status(running=started)
+        self.process_manager.start_cpu_miner()
 
     def _stop_cpu_miner(self) -> None:
         self.process_manager.stop_cpu_miner()
-        self.state.update_cpu_status(running=False, hashrate=0.0)
 
     def _start_gpu_miner(self) -> None:
-        started = self.process_manager.start_gpu_miner()
-        self.state.update_gpu_status(running=started)
+        self.process_manager.start_gpu_miner()
 
     def _stop_gpu_miner(self) -> None:
         self.process_manager.stop_gpu_miner()
-        self.state.update_gpu_status(running=False, hashrate=0.0)
 
     def _seed_default_state(self) -> None:
         """Populate placeholder data so the UI has initial content."""
@@ -867,14 +1589,37 @@ class AppWindow(QMainWindow):
             self.process_miner_output("cpu", line)
 
     def process_miner_output(self, miner_type: str, line: str) -> None:
-        """Parse miner stdout, update metrics, and surface logs."""
-        parser = self.parsers.get(miner_type)
-        if parser is None:
+        """Queue a miner stdout line for parsing; metrics and logs follow in batches."""
+        self.process_miner_lines(miner_type, (line,))
+
+    def process_miner_lines(self, miner_type: str, lines: Iterable[str]) -> None:
+        self._pending_miner_lines.extend((miner_type, line) for line in lines)
+        if self._pending_miner_lines and not self._miner_line_timer.isActive():
+            self._miner_line_timer.start()
+
+    @Slot()
+    def _flush_miner_lines(self) -> None:
+        if not self._pending_miner_lines:
             return
-        metrics, log_entry = parser.parse_line(line)
-        self.state.set_metrics(miner_type, metrics)
-        if log_entry:
-            self.state.add_log_entry(log_entry)
+        lines = list(self._pending_miner_lines)
+        self._pending_miner_lines.clear()
+        self._miner_lines_ready.emit(lines)
+
+    @Slot(list)
+    def _apply_parsed_output(self, results: list) -> None:
+        now = time.time()
+        statuses = {
+            "cpu": (self.state.cpu_status, self.state.update_cpu_status),
+            "gpu": (self.state.gpu_status, self.state.update_gpu_status),
+        }
+        with self.state.begin_batch():
+            for miner_type, metrics, log_entries in results:
+                self.state.set_metrics(miner_type, metrics)
+                self.state.add_log_entries(log_entries)
+                status, updater = statuses[miner_type]
+                if status.running:
+                    # Miner output is the heartbeat HealthMonitor watches for.
+                    updater(last_heartbeat=now)
 
     def _open_wallet_dialog(self) -> None:
         dialog = WalletCredentialsDialog(self.state.config, parent=self)
@@ -884,27 +1629,121 @@ class AppWindow(QMainWindow):
             self.refresh_wallet_data(force=True)
 
     def refresh_wallet_data(self, force: bool = False) -> None:
-        """Refresh wallet data from the API asynchronously."""
-        if self._inflight_wallet_future and not self._inflight_wallet_future.done():
-            if not force:
+        """Refresh wallet data from the API asynchronously.
+
+        Unforced refreshes are served from a short-lived cache, and any refresh
+        for a wallet that is already being fetched joins that request.
+        """
+        config = self.state.config
+        if not config.wallet_username or (not force and self._is_hidden()):
+            return
+
+        # Keyed on the token too, so changed credentials always trigger a fetch.
+        key = (config.server, config.port, config.wallet_username, config.wallet_token)
+        if not force:
+            cached = self._wallet_cache.get(key)
+            if cached is not None:
+                if cached is not self.state.wallet:
+                    self.state.set_wallet(cached)
                 return
-            self._inflight_wallet_future.cancel()
+        if self._wallet_cache.inflight(key) is not None:
+            return
 
-        credentials = WalletCredentials(
-            username=self.state.config.wallet_username,
-            token=self.state.config.wallet_token or None,
-        )
-        if not credentials.username:
+        credentials = WalletCredentials(username=config.wallet_username, token=config.wallet_token or None)
+        runnable = WalletFetchRunnable(self.wallet_client.fetch_wallet, credentials, tag=key)
+        runnable.signals.finished.connect(self._handle_wallet_result)
+        self._wallet_cache.track(key, runnable.start())
+
+    @Slot()
+    def _on_refresh_timer(self) -> None:
+        if not self.state.config.wallet_username:
+            # Nothing to poll; _handle_config_changed re-arms once a wallet is set.
+            return
+        if self._wallet_stream_live:
+            self.refresh_wallet_data()
+            self.refresh_timer.start(WALLET_WATCHDOG_MS)
+            return
+        if self._is_hidden():
+            # Stay idle until the window is shown again; see _resume_wallet_refresh.
+            self._refresh_paused = True
+            return
+        self.refresh_wallet_data()
+        self.refresh_timer.start(int(self._refresh_schedule.current_seconds * 1000))
+
+    @Slot()
+    def _start_wallet_stream(self) -> None:
+        """Subscribe to pushed wallet updates; polling continues until it connects."""
+        config = self.state.config
+        if not config.wallet_username:
+            self._stop_wallet_stream()
+            return
+        key = (config.server, config.port, config.wallet_username, config.wallet_token)
+        if key == self._wallet_stream_unavailable:
+            return
+        if self._wallet_stream is not None and self._wallet_stream_key == key:
             return
+        self._stop_wallet_stream()
+        credentials = WalletCredentials(username=config.wallet_username, token=config.wallet_token or None)
+        worker = WalletStreamWorker(self.wallet_client, credentials)
+        worker.connected.connect(self._on_wallet_stream_connected)
+        worker.updated.connect(self._on_wallet_stream_update)
+        worker.unavailable.connect(self._on_wallet_stream_unavailable)
+        worker.disconnected.connect(self._on_wallet_stream_disconnected)
+        self._wallet_stream = worker
+        self._wallet_stream_key = key
+        worker.start()
+
+    def _stop_wallet_stream(self) -> None:
+        worker, self._wallet_stream = self._wallet_stream, None
+        self._wallet_stream_key = None
+        self._wallet_stream_live = False
+        if worker is not None:
+            worker.stop()
+
+    @Slot()
+    def _on_wallet_stream_connected(self) -> None:
+        if self.sender() is not self._wallet_stream:
+            return
+        self._wallet_stream_live = True
+        self.refresh_timer.start(WALLET_WATCHDOG_MS)
 
-        self._inflight_wallet_future = self._wallet_executor.submit(
-            self.wallet_client.fetch_wallet, credentials
-        )
-        self._inflight_wallet_future.add_done_callback(self._handle_wallet_result)
+    @Slot(WalletData)
+    def _on_wallet_stream_update(self, wallet: WalletData) -> None:
+        if self.sender() is not self._wallet_stream or self._wallet_stream_key is None:
+            return
+        self._wallet_cache.put(self._wallet_stream_key, wallet)
+        self.state.set_wallet(wallet)
 
-    def _handle_wallet_result(self, future: Future) -> None:
+    @Slot()
+    def _on_wallet_stream_unavailable(self) -> None:
+        if self.sender() is not self._wallet_stream:
+            return
+        # Remember the server has no stream so config changes keep polling quietly.
+        self._wallet_stream_unavailable = self._wallet_stream_key
+        self._wallet_stream = None
+        self._wallet_stream_key = None
+        self._wallet_stream_live = False
+        self.refresh_timer.start(int(self._refresh_schedule.current_seconds * 1000))
+
+    @Slot(str)
+    def _on_wallet_stream_disconnected(self, message: str) -> None:
+        if self.sender() is not self._wallet_stream:
+            return
+        self.state.logger.warning(message)
+        self._wallet_stream = None
+        self._wallet_stream_key = None
+        self._wallet_stream_live = False
+        # Fall back to polling and try the stream again later.
+        self.refresh_timer.start(int(self._refresh_schedule.current_seconds * 1000))
+        self._wallet_stream_retry.start()
+
+    @Slot(object, object)
+    def _handle_wallet_result(self, key: tuple, future: Future) -> None:
+        fetched = False
         try:
             wallet = future.result()
+            self._wallet_cache.put(key, wallet)
+            fetched = True
         except WalletAuthError:
             wallet = WalletData(
                 username=self.state.config.wallet_username,
@@ -927,23 +1766,85 @@ class AppWindow(QMainWindow):
                 last_payout="Unable to refresh",
             )
 
-        QTimer.singleShot(0, lambda: self.state.set_wallet(wallet))
+        self._apply_wallet_result(wallet, fetched)
 
+    def _apply_wallet_result(self, wallet: WalletData, fetched: bool) -> None:
+        if wallet is not self.state.wallet:
+            self.state.set_wallet(wallet)
+        if not fetched or not self.state.config.adaptive_refresh:
+            return
+        previous = self._refresh_schedule.current_seconds
+        interval = self._refresh_schedule.observe(wallet)
+        if interval < previous:
+            # The wallet changed after a quiet spell; poll at the base rate again now.
+            self.refresh_timer.start(int(interval * 1000))
+
+    @Slot(Configuration)
     def _handle_config_changed(self, config: Configuration) -> None:
-        self.wallet_client = WalletClient(server=config.server)
-        self.refresh_timer.setInterval(config.refresh_interval * 1000)
+        client = WalletClient(server=config.server, session=_SESSION)
+        if client.base_url != self.wallet_client.base_url:
+            # Only swap clients when the host changes, so a live event stream keeps its client.
+            self.wallet_client = client
+        self._refresh_schedule.reset(config.refresh_interval)
+        self._wallet_cache.ttl_seconds = _wallet_cache_ttl(config.refresh_interval)
+        self._start_wallet_stream()
+        if not config.wallet_username:
+            self.refresh_timer.stop()
+        elif not self._wallet_stream_live:
+            self.refresh_timer.start(config.refresh_interval * 1000)
+
+    def _is_hidden(self) -> bool:
+        return (
+            not self.isVisible()
+            or self.isMinimized()
+            or QApplication.applicationState() == Qt.ApplicationSuspended
+        )
+
+    def _resume_wallet_refresh(self) -> None:
+        if not self._refresh_paused or self._is_hidden():
+            return
+        self._refresh_paused = False
+        self.refresh_wallet_data(force=True)
+        if not self._wallet_stream_live:
+            self.refresh_timer.start(int(self._refresh_schedule.current_seconds * 1000))
+
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        super().showEvent(event)
+        self._resume_wallet_refresh()
+
+    def changeEvent(self, event) -> None:  # type: ignore[override]
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange and not self.isMinimized():
+            # Children get no showEvent on restore; replay what they skipped.
+            for panel in self.panels:
+                if isinstance(panel, StatePanel):
+                    panel.flush_deferred()
+            self._resume_wallet_refresh()
+
+    @Slot(Qt.ApplicationState)
+    def _on_application_state(self, state: Qt.ApplicationState) -> None:
+        if state != Qt.ApplicationSuspended:
+            self._resume_wallet_refresh()
 
     def closeEvent(self, event) -> None:  # type: ignore[override]
-        self._wallet_executor.shutdown(cancel_futures=True)
+        self._wallet_stream_retry.stop()
+        self._stop_wallet_stream()
+        # Queued wallet lookups become no-ops instead of running during exit.
+        self._wallet_cache.cancel_inflight()
+        self._miner_line_timer.stop()
+        self._parser_thread.quit()
+        self._parser_thread.wait(1_000)
         super().closeEvent(event)
 
 
 def main(argv: Iterable[str] | None = None) -> int:
     """Start the PySide6 application."""
-    app = QApplication(list(argv) if argv is not None else sys.argv)
+    app = QApplication(sys.argv if argv is None else list(argv))
     state = AppState()
     state.set_config(load_config(state.config))
-    state.config_changed.connect(save_config)
+    config_saver = ConfigSaver(app)
+    state.config_changed.connect(config_saver.schedule)
+    app.aboutToQuit.connect(config_saver.flush)
     window = AppWindow(state)
     window.resize(600, 800)
     window.show()
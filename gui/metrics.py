@@ -6,15 +6,17 @@ import re
 from collections import deque
 from dataclasses import replace
 from datetime import datetime, timedelta
-from typing import Deque, Optional, Tuple
+from typing import Deque, Iterable, List, Optional, Tuple
 
 from .state import MinerLogEntry, MinerMetrics
 
 
-HASHRATE_PATTERN = re.compile(r"(?P<value>\\d+(?:\\.\\d+)?)\\s*(?P<unit>mh/s|kh/s|h/s)", re.IGNORECASE)
-TEMP_PATTERN = re.compile(r"(temp(?:erature)?[:=]?\\s*)(?P<value>\\d+(?:\\.\\d+)?)", re.IGNORECASE)
-REWARD_PATTERN = re.compile(r"(?P<value>\\d+(?:\\.\\d+)?)\\s*duco", re.IGNORECASE)
-SHARE_RATE_PATTERN = re.compile(r"share rate[:=]?\\s*(?P<value>\\d+(?:\\.\\d+)?)/?\\s*(?:m|min)", re.IGNORECASE)
+HASHRATE_PATTERN = re.compile(r"(?P<value>\d+(?:\.\d+)?)\s*(?P<unit>mh/s|kh/s|h/s)", re.IGNORECASE)
+TEMP_PATTERN = re.compile(r"(temp(?:erature)?[:=]?\s*)(?P<value>\d+(?:\.\d+)?)", re.IGNORECASE)
+REWARD_PATTERN = re.compile(r"(?P<value>\d+(?:\.\d+)?)\s*duco", re.IGNORECASE)
+SHARE_RATE_PATTERN = re.compile(r"share rate[:=]?\s*(?P<value>\d+(?:\.\d+)?)/?\s*(?:m|min)", re.IGNORECASE)
+# Substrings that mark a miner line as an error.
+ERROR_TERMS = ("error", "disconnect", "timeout")
 
 
 def _normalize_hashrate(value: float, unit: str) -> float:
@@ -74,7 +76,7 @@ class MinerMetricsParser:
         elif reward_in_line:
             metrics.rewards_duco += float(reward_in_line)
 
-        if any(term in lowered for term in ["error", "disconnect", "timeout"]):
+        if any(term in lowered for term in ERROR_TERMS):
             metrics.last_error = text
             log_entry = MinerLogEntry(level="error", message=text)
 
@@ -87,6 +89,16 @@ class MinerMetricsParser:
         self.metrics = metrics
         return metrics, log_entry
 
+    def parse_lines(self, lines: Iterable[str]) -> Tuple[MinerMetrics, List[MinerLogEntry]]:
+        """Parse a batch of stdout lines, returning the final metrics and all log entries."""
+        parse_line = self.parse_line
+        log_entries: List[MinerLogEntry] = []
+        for line in lines:
+            _, log_entry = parse_line(line)
+            if log_entry is not None:
+                log_entries.append(log_entry)
+        return self.metrics, log_entries
+
     def _track_share_event(self) -> None:
         now = datetime.utcnow()
         self.share_events.append(now)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import codecs
+import locale
 import os
 import signal
 import subprocess
@@ -9,18 +11,30 @@ import sys
 import threading
 from collections import deque
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Callable, Iterable, List, Optional
+
+from PySide6.QtCore import QObject, Signal
 
 STDOUT_BUFFER = 500
+# Bytes taken from the miner's stdout pipe per read; one read yields a batch of lines.
+READ_CHUNK = 64 * 1024
 
 
 class ManagedMinerProcess:
     """Handle starting and stopping an individual miner process safely."""
 
-    def __init__(self, script_path: Path, workdir: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        script_path: Path,
+        workdir: Optional[Path] = None,
+        on_exit: Optional[Callable[[], None]] = None,
+        on_output: Optional[Callable[[List[str]], None]] = None,
+    ) -> None:
         self.script_path = script_path
         self.workdir = workdir
-        self.process: Optional[subprocess.Popen[str]] = None
+        self.on_exit = on_exit
+        self.on_output = on_output
+        self.process: Optional[subprocess.Popen[bytes]] = None
         self._stdout_lines: deque[str] = deque(maxlen=STDOUT_BUFFER)
         self._stdout_thread: Optional[threading.Thread] = None
 
@@ -36,15 +50,16 @@ class ManagedMinerProcess:
         if self.is_running:
             return True
 
-        command = [sys.executable, str(self.script_path)]
+        # Unbuffered so status lines arrive as they are printed; parsed output is the heartbeat.
+        command = [sys.executable, "-u", str(self.script_path)]
         if extra_args:
             command.extend(extra_args)
 
         popen_kwargs: dict = {
             "stdout": subprocess.PIPE,
             "stderr": subprocess.STDOUT,
-            "text": True,
             "cwd": str(self.workdir) if self.workdir else None,
+            "env": {**os.environ, "PYTHONUNBUFFERED": "1"},
         }
 
         if os.name == "nt":
@@ -58,60 +73,110 @@ class ManagedMinerProcess:
             self.process = None
             return False
 
-        self._stdout_thread = threading.Thread(target=self._capture_stdout, daemon=True)
+        self._stdout_thread = threading.Thread(target=self._capture_stdout, args=(self.process,), daemon=True)
         self._stdout_thread.start()
         return True
 
     def stop(self, timeout: float = 5.0) -> None:
-        if not self.is_running or self.process is None:
-            self.process = None
+        process, self.process = self.process, None
+        # Detach first so the reader thread sees this exit as requested, not a crash.
+        if process is None or process.poll() is not None:
             return
 
         try:
             if os.name == "nt":
-                self.process.send_signal(signal.CTRL_BREAK_EVENT)
+                process.send_signal(signal.CTRL_BREAK_EVENT)
             else:
-                os.killpg(self.process.pid, signal.SIGTERM)
+                os.killpg(process.pid, signal.SIGTERM)
         except (ProcessLookupError, ValueError):
-            self.process.terminate()
+            process.terminate()
 
         try:
-            self.process.wait(timeout=timeout)
+            process.wait(timeout=timeout)
         except subprocess.TimeoutExpired:
-            self.process.kill()
-        finally:
-            self.process = None
-
-    def _capture_stdout(self) -> None:
-        if not self.process or not self.process.stdout:
+            process.kill()
+
+    def _capture_stdout(self, process: subprocess.Popen[bytes]) -> None:
+        # Read whatever the pipe holds and hand complete lines on in batches
+        # rather than dispatching one Python callback per line.
+        decoder = codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors="replace")
+        partial = ""
+        if process.stdout:
+            while True:
+                chunk = process.stdout.read1(READ_CHUNK)
+                if not chunk:
+                    break
+                *lines, partial = (partial + decoder.decode(chunk)).split("\n")
+                self._publish(lines)
+            partial += decoder.decode(b"", final=True)
+            if partial:
+                self._publish([partial])
+        # stdout closes when the miner exits, so this thread doubles as the exit watcher.
+        process.wait()
+        # Only report exits of the current process; a stopped or replaced one
+        # must not mark a restarted miner as stopped.
+        if self.on_exit is not None and process is self.process:
+            self.on_exit()
+
+    def _publish(self, lines: List[str]) -> None:
+        lines = [line.rstrip("\r") for line in lines]
+        if not lines:
             return
-        for line in self.process.stdout:
-            self._stdout_lines.append(line.rstrip("\n"))
+        self._stdout_lines.extend(lines)
+        if self.on_output is not None:
+            self.on_output(lines)
 
 
-class MinerProcessManager:
-    """Facade to manage both CPU and GPU miner subprocesses."""
+class MinerProcessManager(QObject):
+    """Facade to manage both CPU and GPU miner subprocesses.
 
-    def __init__(self) -> None:
+    The state signals fire on start, stop and unexpected exit; exits and
+    batches of output lines are reported from the stdout reader thread, so
+    receivers get queued calls.
+    """
+
+    cpu_state_changed = Signal(bool)
+    gpu_state_changed = Signal(bool)
+    cpu_output = Signal(list)
+    gpu_output = Signal(list)
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
         base_dir = Path(__file__).resolve().parent.parent
-        self.cpu_miner = ManagedMinerProcess(base_dir / "PC_Miner.py", workdir=base_dir)
-        self.gpu_miner = ManagedMinerProcess(base_dir / "GPU_Miner.py", workdir=base_dir)
+        self.cpu_miner = ManagedMinerProcess(
+            base_dir / "PC_Miner.py",
+            workdir=base_dir,
+            on_exit=lambda: self.cpu_state_changed.emit(False),
+            on_output=self.cpu_output.emit,
+        )
+        self.gpu_miner = ManagedMinerProcess(
+            base_dir / "GPU_Miner.py",
+            workdir=base_dir,
+            on_exit=lambda: self.gpu_state_changed.emit(False),
+            on_output=self.gpu_output.emit,
+        )
 
     def start_cpu_miner(self) -> bool:
-        return self.cpu_miner.start()
+        started = self.cpu_miner.start()
+        self.cpu_state_changed.emit(started)
+        return started
 
     def stop_cpu_miner(self) -> None:
         self.cpu_miner.stop()
+        self.cpu_state_changed.emit(False)
 
     def start_gpu_miner(self) -> bool:
-        return self.gpu_miner.start()
+        started = self.gpu_miner.start()
+        self.gpu_state_changed.emit(started)
+        return started
 
     def stop_gpu_miner(self) -> None:
         self.gpu_miner.stop()
+        self.gpu_state_changed.emit(False)
 
     def stop_all(self) -> None:
-        self.cpu_miner.stop()
-        self.gpu_miner.stop()
+        self.stop_cpu_miner()
+        self.stop_gpu_miner()
 
     def is_cpu_running(self) -> bool:
         return self.cpu_miner.is_running
@@ -4,17 +4,18 @@ from __future__ import annotations
 
 import logging
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field, replace
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import List, Optional
+from typing import Hashable, Iterable, Iterator, List, Optional
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, SignalInstance
 
-from .config import Configuration as BaseConfiguration, validate_config
+from .config import DATACLASS_SLOTS, Configuration as BaseConfiguration, validate_config
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class WalletData:
     """Represents wallet metadata and balances."""
 
@@ -24,7 +25,7 @@ class WalletData:
     last_payout: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MinerStatus:
     """Represents status for a single miner."""
 
@@ -38,7 +39,15 @@ class MinerStatus:
     last_heartbeat: Optional[float] = None
 
 
-@dataclass
+def _heartbeat_only(previous: MinerStatus, current: MinerStatus) -> bool:
+    """True when only ``last_heartbeat`` differs, which listeners need not hear about.
+
+    HealthMonitor reads the heartbeat from AppState when its timer fires.
+    """
+    return replace(current, last_heartbeat=previous.last_heartbeat) == previous
+
+
+@dataclass(**DATACLASS_SLOTS)
 class MinerMetrics:
     """Normalized metrics derived from miner stdout."""
 
@@ -52,7 +61,11 @@ class MinerMetrics:
     last_error: Optional[str] = None
 
 
-@dataclass
+# Shared "no metrics yet" value; always copy with replace() rather than mutating it.
+DEFAULT_METRICS = MinerMetrics()
+
+
+@dataclass(**DATACLASS_SLOTS)
 class MinerLogEntry:
     """A recent message emitted by the miner processes."""
 
@@ -60,7 +73,7 @@ class MinerLogEntry:
     message: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LiveStats:
     """Aggregated statistics about the mining session."""
 
@@ -70,7 +83,7 @@ class LiveStats:
     ping_ms: Optional[float] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Configuration(BaseConfiguration):
     """User configuration for the miners."""
 
@@ -78,7 +91,7 @@ class Configuration(BaseConfiguration):
     wallet_token: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class NotificationEntry:
     """Represents an in-app notification about miner health or API errors."""
 
@@ -113,44 +126,83 @@ class AppState(QObject):
         self._configure_logger()
         self.metrics: dict[str, MinerMetrics] = {"cpu": MinerMetrics(), "gpu": MinerMetrics()}
         self.logs: List[MinerLogEntry] = []
+        self._batch_depth = 0
+        self._deferred: dict[Hashable, tuple[Optional[Hashable], SignalInstance, tuple]] = {}
+        self._last_emitted: dict[Hashable, tuple] = {}
+
+    @contextmanager
+    def begin_batch(self) -> Iterator[None]:
+        """Defer signals until the outermost batch exits.
+
+        Snapshot signals (wallet, status, stats, config, per-miner metrics) are
+        collapsed to their latest value; notification and log entries are all kept.
+        A snapshot equal to the last one emitted for its key is dropped.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                deferred, self._deferred = self._deferred, {}
+                for key, signal, args in deferred.values():
+                    self._send(key, signal, args)
+
+    def _emit(self, key: Optional[Hashable], signal: SignalInstance, *args: object) -> None:
+        if not self._batch_depth:
+            self._send(key, signal, args)
+            return
+        self._deferred[object() if key is None else key] = (key, signal, args)
+
+    def _send(self, key: Optional[Hashable], signal: SignalInstance, args: tuple) -> None:
+        if key is not None:
+            # Payloads are replaced, never mutated, so value equality means nothing changed.
+            if self._last_emitted.get(key) == args:
+                return
+            self._last_emitted[key] = args
+        signal.emit(*args)
 
     def set_wallet(self, wallet: WalletData) -> None:
         self.wallet = wallet
-        self.wallet_changed.emit(self.wallet)
+        self._emit("wallet_changed", self.wallet_changed, self.wallet)
 
     def update_wallet(self, **updates) -> None:
         self.wallet = replace(self.wallet, **updates)
-        self.wallet_changed.emit(self.wallet)
+        self._emit("wallet_changed", self.wallet_changed, self.wallet)
 
     def set_cpu_status(self, status: MinerStatus) -> None:
         self.cpu_status = status
-        self.cpu_status_changed.emit(self.cpu_status)
+        self._emit("cpu_status_changed", self.cpu_status_changed, self.cpu_status)
 
     def update_cpu_status(self, **updates) -> None:
-        prepared = self._prepare_status_updates(self.cpu_status, updates)
-        self.cpu_status = replace(self.cpu_status, **prepared)
-        self.cpu_status_changed.emit(self.cpu_status)
+        previous = self.cpu_status
+        prepared = self._prepare_status_updates(previous, updates)
+        self.cpu_status = replace(previous, **prepared)
+        if not _heartbeat_only(previous, self.cpu_status):
+            self._emit("cpu_status_changed", self.cpu_status_changed, self.cpu_status)
 
     def set_gpu_status(self, status: MinerStatus) -> None:
         self.gpu_status = status
-        self.gpu_status_changed.emit(self.gpu_status)
+        self._emit("gpu_status_changed", self.gpu_status_changed, self.gpu_status)
 
     def update_gpu_status(self, **updates) -> None:
-        prepared = self._prepare_status_updates(self.gpu_status, updates)
-        self.gpu_status = replace(self.gpu_status, **prepared)
-        self.gpu_status_changed.emit(self.gpu_status)
+        previous = self.gpu_status
+        prepared = self._prepare_status_updates(previous, updates)
+        self.gpu_status = replace(previous, **prepared)
+        if not _heartbeat_only(previous, self.gpu_status):
+            self._emit("gpu_status_changed", self.gpu_status_changed, self.gpu_status)
 
     def set_live_stats(self, stats: LiveStats) -> None:
         self.live_stats = stats
-        self.stats_changed.emit(self.live_stats)
+        self._emit("stats_changed", self.stats_changed, self.live_stats)
 
     def update_live_stats(self, **updates) -> None:
         self.live_stats = replace(self.live_stats, **updates)
-        self.stats_changed.emit(self.live_stats)
+        self._emit("stats_changed", self.stats_changed, self.live_stats)
 
     def set_config(self, config: Configuration) -> None:
         self.config = validate_config(config)
-        self.config_changed.emit(self.config)
+        self._emit("config_changed", self.config_changed, self.config)
 
     def update_config(self, **updates) -> None:
         updated = replace(self.config, **updates)
@@ -159,7 +211,7 @@ class AppState(QObject):
     def add_notification(self, message: str, severity: str = "info", miner: Optional[str] = None) -> None:
         entry = NotificationEntry(message=message, severity=severity, miner=miner)
         self.notifications.append(entry)
-        self.notification_added.emit(entry)
+        self._emit(None, self.notification_added, entry)
 
     def log_error(self, message: str) -> None:
         self.logger.error(message)
@@ -176,14 +228,36 @@ class AppState(QObject):
             data = prefix + data
         return data.decode("utf-8", errors="replace")
 
+    def read_log_tail_since(self, offset: int, max_bytes: int = 32_000) -> tuple[str, int]:
+        """Return log text written after ``offset`` and the offset to resume from.
+
+        A file shorter than ``offset`` has been rotated, so reading restarts at
+        the beginning; callers can detect this by the returned offset shrinking.
+        """
+        try:
+            with self.log_path.open("rb") as handle:
+                size = handle.seek(0, 2)
+                if size < offset:
+                    offset = 0
+                start = max(offset, size - max_bytes)
+                handle.seek(start)
+                data = handle.read()
+        except FileNotFoundError:
+            return "", 0
+        new_offset = start + len(data)
+        if start > offset:
+            data = b"... (truncated)\n" + data
+        return data.decode("utf-8", errors="replace"), new_offset
+
     def _prepare_status_updates(self, status: MinerStatus, updates: dict) -> dict:
         prepared = dict(updates)
         running = prepared.get("running", status.running)
-        if running:
-            prepared.setdefault("connected", True)
+        # Every running=True report is a heartbeat; the connection default only
+        # applies when the miner starts or stops.
+        if running and "running" in updates:
             prepared.setdefault("last_heartbeat", time.time())
-        else:
-            prepared.setdefault("connected", False)
+        if running != status.running:
+            prepared.setdefault("connected", running)
         return prepared
 
     def _configure_logger(self) -> None:
@@ -199,16 +273,22 @@ class AppState(QObject):
     def set_metrics(self, miner_type: str, metrics: MinerMetrics) -> None:
         """Persist metrics for a miner (e.g., 'cpu' or 'gpu') and emit changes."""
         self.metrics[miner_type] = metrics
-        self.metrics_changed.emit(miner_type, metrics)
+        self._emit(("metrics_changed", miner_type), self.metrics_changed, miner_type, metrics)
 
     def update_metrics(self, miner_type: str, **updates) -> None:
-        current = self.metrics.get(miner_type, MinerMetrics())
+        current = self.metrics.get(miner_type, DEFAULT_METRICS)
         self.metrics[miner_type] = replace(current, **updates)
-        self.metrics_changed.emit(miner_type, self.metrics[miner_type])
+        self._emit(("metrics_changed", miner_type), self.metrics_changed, miner_type, self.metrics[miner_type])
 
     def add_log_entry(self, entry: MinerLogEntry, max_entries: int = 100) -> None:
         """Append a log entry and keep the buffer bounded."""
-        self.logs.append(entry)
+        self.add_log_entries((entry,), max_entries)
+
+    def add_log_entries(self, entries: Iterable[MinerLogEntry], max_entries: int = 100) -> None:
+        """Append several log entries, trimming the buffer once."""
+        entries = list(entries)
+        self.logs.extend(entries)
         if len(self.logs) > max_entries:
             self.logs = self.logs[-max_entries:]
-        self.log_added.emit(entry)
+        for entry in entries:
+            self._emit(None, self.log_added, entry)
@@ -0,0 +1,49 @@
+"""Helpers for coalescing bursty signal traffic before it reaches the UI."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QObject, QTimer
+
+
+class Throttler(QObject):
+    """Invoke a callback at most once per interval with the latest arguments.
+
+    The first call runs immediately; calls arriving while the interval is
+    running are collapsed into a single trailing call once it elapses.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[..., Any],
+        interval_ms: int = 100,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._callback = callback
+        self._pending: Optional[tuple] = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._on_timeout)
+
+    def __call__(self, *args: Any) -> None:
+        if self._timer.isActive():
+            self._pending = args
+            return
+        self._callback(*args)
+        self._timer.start()
+
+    def flush(self) -> None:
+        """Run any pending trailing call right away."""
+        if self._pending is not None:
+            self._timer.stop()
+            self._on_timeout()
+
+    def _on_timeout(self) -> None:
+        if self._pending is None:
+            return
+        args, self._pending = self._pending, None
+        self._callback(*args)
+        self._timer.start()
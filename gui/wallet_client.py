@@ -2,13 +2,30 @@
 
 from __future__ import annotations
 
+import json
+import time
+from concurrent.futures import Future
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Hashable, Iterator, Optional
 
 import requests
+from urllib3.exceptions import ReadTimeoutError
 
 from .state import WalletData
 
+# (connect, read) seconds; short enough that a stuck request never holds up shutdown for long.
+REQUEST_TIMEOUT = (3, 5)
+# Read timeout for the wallet event stream; a quiet stream is reopened after this.
+STREAM_READ_TIMEOUT = 30
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+# orjson decodes bytes directly and raises a ValueError subclass, like json.
+load_json = orjson.loads if orjson is not None else json.loads
+
 
 class WalletClientError(Exception):
     """Base error for wallet client failures."""
@@ -18,6 +35,14 @@ class WalletAuthError(WalletClientError):
     """Raised when credentials are missing or invalid."""
 
 
+class WalletStreamTimeout(WalletClientError):
+    """Raised when the wallet event stream is silent for longer than its read timeout."""
+
+
+class WalletStreamUnavailable(WalletClientError):
+    """Raised when the server does not offer the wallet event stream."""
+
+
 @dataclass
 class WalletCredentials:
     """Credentials required to talk to the wallet API."""
@@ -40,21 +65,102 @@ class WalletClient:
             host = f"{host}:{port}"
         self.base_url = f"https://{host}"
         self.session = session or requests.Session()
+        # url -> (ETag, wallet parsed from that response)
+        self._etags: dict[str, tuple[str, WalletData]] = {}
 
     def fetch_wallet(self, credentials: WalletCredentials) -> WalletData:
-        """Fetch wallet balances and stats."""
+        """Fetch wallet balances and stats.
+
+        Requests are conditional on the ETag of the last good response; a
+        304 Not Modified returns the wallet parsed from that response.
+        """
         if not credentials.username:
             raise WalletAuthError("Wallet username is missing")
 
         url = f"{self.base_url}/users/{credentials.username}"
+        headers = self._auth_headers(credentials)
+        cached = self._etags.get(url)
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+        try:
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT, headers=headers)
+            if cached is not None and response.status_code == 304:
+                return cached[1]
+            response.raise_for_status()
+            wallet = self._wallet_from_payload(load_json(response.content), credentials)
+        except Exception:
+            # Make the next request unconditional rather than trusting a stale ETag.
+            self._etags.pop(url, None)
+            raise
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etags[url] = (etag, wallet)
+        else:
+            self._etags.pop(url, None)
+        return wallet
+
+    def open_wallet_stream(self, credentials: WalletCredentials) -> requests.Response:
+        """Open the server-sent event stream of wallet updates.
+
+        The caller owns the returned response and should close it to stop the stream.
+        """
+        if not credentials.username:
+            raise WalletAuthError("Wallet username is missing")
+
+        headers = self._auth_headers(credentials)
+        headers["Accept"] = "text/event-stream"
+        response = self.session.get(
+            f"{self.base_url}/wallet/events",
+            params={"username": credentials.username},
+            headers=headers,
+            stream=True,
+            timeout=(REQUEST_TIMEOUT[0], STREAM_READ_TIMEOUT),
+        )
+        if response.status_code == 404:
+            response.close()
+            raise WalletStreamUnavailable("Wallet event stream is not available")
+        response.raise_for_status()
+        return response
+
+    def iter_wallet_events(
+        self, response: requests.Response, credentials: WalletCredentials
+    ) -> Iterator[Optional[WalletData]]:
+        """Yield a wallet for every ``data:`` event received on ``response``.
+
+        Every other line, keep-alive comments included, yields ``None`` so the
+        caller gets control back on each read. Raises WalletStreamTimeout when
+        nothing arrives within the stream's read timeout.
+        """
+        data_lines: list[str] = []
+        try:
+            for line in response.iter_lines(decode_unicode=True):
+                if line:
+                    if line.startswith("data:"):
+                        data_lines.append(line[5:].lstrip())
+                    yield None
+                    continue
+                if not data_lines:
+                    yield None
+                    continue
+                payload = load_json("\n".join(data_lines))
+                data_lines = []
+                yield self._wallet_from_payload(payload, credentials)
+        except requests.ConnectionError as exc:
+            # requests reports a read timeout mid-stream as a wrapped ConnectionError.
+            if exc.args and isinstance(exc.args[0], ReadTimeoutError):
+                raise WalletStreamTimeout("Wallet event stream timed out") from exc
+            raise
+        except requests.Timeout as exc:
+            raise WalletStreamTimeout("Wallet event stream timed out") from exc
+
+    @staticmethod
+    def _auth_headers(credentials: WalletCredentials) -> dict[str, str]:
         headers = {}
         if credentials.token:
             headers["Authorization"] = f"Bearer {credentials.token}"
+        return headers
 
-        response = self.session.get(url, timeout=10, headers=headers)
-        response.raise_for_status()
-        payload = response.json()
-
+    def _wallet_from_payload(self, payload: Any, credentials: WalletCredentials) -> WalletData:
         if payload.get("success") is False:
             message = payload.get("message") or "Unknown error from wallet API"
             if "auth" in message.lower():
@@ -109,3 +215,78 @@ class WalletClient:
             if tx.get("type", "").lower() in {"payout", "mining"}:
                 return tx.get("datetime") or tx.get("timestamp")
         return None
+
+
+class WalletCache:
+    """Short-lived cache of wallet lookups that coalesces concurrent requests per key."""
+
+    def __init__(self, ttl_seconds: float = 5.0) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[Hashable, tuple[float, WalletData]] = {}
+        self._inflight: dict[Hashable, Future] = {}
+
+    def get(self, key: Hashable) -> Optional[WalletData]:
+        """Return the cached wallet for ``key`` if it has not expired."""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() >= entry[0]:
+            return None
+        return entry[1]
+
+    def put(self, key: Hashable, wallet: WalletData) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, wallet)
+
+    def inflight(self, key: Hashable) -> Optional[Future]:
+        """Return the pending lookup for ``key``, if one is still running."""
+        future = self._inflight.get(key)
+        if future is not None and future.done():
+            self._inflight.pop(key, None)
+            return None
+        return future
+
+    def track(self, key: Hashable, future: Future) -> None:
+        self._inflight[key] = future
+
+    def cancel_inflight(self) -> None:
+        """Cancel lookups that have not started yet; running ones finish on their own."""
+        for future in self._inflight.values():
+            future.cancel()
+        self._inflight.clear()
+
+
+class AdaptiveRefreshInterval:
+    """Stretch the wallet refresh interval while the wallet stays unchanged."""
+
+    def __init__(
+        self,
+        base_seconds: float,
+        stable_after: int = 3,
+        growth: float = 1.5,
+        max_factor: float = 10.0,
+        max_seconds: float = 60.0,
+    ) -> None:
+        self.stable_after = stable_after
+        self.growth = growth
+        self.max_factor = max_factor
+        self.max_seconds = max_seconds
+        self.reset(base_seconds)
+
+    def reset(self, base_seconds: float) -> None:
+        self.base_seconds = base_seconds
+        self.current_seconds = base_seconds
+        self._last_fingerprint: Optional[tuple] = None
+        self._unchanged = 0
+
+    def observe(self, wallet: WalletData) -> float:
+        """Record a fetched wallet and return the interval until the next refresh."""
+        fingerprint = (wallet.balance, wallet.pending_rewards, wallet.last_payout)
+        if fingerprint == self._last_fingerprint:
+            self._unchanged += 1
+            if self._unchanged >= self.stable_after:
+                # Never stretch past a minute, but never drop below the user's own interval.
+                ceiling = max(self.base_seconds, min(self.base_seconds * self.max_factor, self.max_seconds))
+                self.current_seconds = min(self.current_seconds * self.growth, ceiling)
+        else:
+            self._unchanged = 0
+            self.current_seconds = self.base_seconds
+        self._last_fingerprint = fingerprint
+        return self.current_seconds